@@ -7,12 +7,14 @@ explaining WHY patterns are problematic and HOW to fix them using real-world cas
 Phase 1.2 enhancement: Dedicated educational content system with multiple detail levels.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 from dataclasses import dataclass
 from enum import Enum
 
+from ..utils.dataclass_utils import DATACLASS_SLOTS
+from ..utils.json_serialization import loads
+
 
 class DetailLevel(Enum):
     """Educational content detail levels"""
@@ -33,8 +35,21 @@ class CaseStudy:
     lesson: str
     prevention_checklist: List[str]
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary (cheaper than dataclasses.asdict)"""
+        return {
+            "title": self.title,
+            "pattern_type": self.pattern_type,
+            "timeline": self.timeline,
+            "outcome": self.outcome,
+            "impact": dict(self.impact),
+            "root_cause": self.root_cause,
+            "lesson": self.lesson,
+            "prevention_checklist": list(self.prevention_checklist)
+        }
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class EducationalResponse:
     """Comprehensive educational response"""
     pattern_name: str
@@ -64,6 +79,32 @@ class EducationalResponse:
     detail_level: DetailLevel
     response_time: Optional[float] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a dictionary with the same shape as dataclasses.asdict().
+
+        Lists are copied shallowly since they only hold strings; this avoids the
+        recursive deep copy performed by asdict on every response.
+        """
+        return {
+            "pattern_name": self.pattern_name,
+            "pattern_type": self.pattern_type,
+            "severity": self.severity,
+            "confidence": self.confidence,
+            "why_problematic": self.why_problematic,
+            "impact_explanation": self.impact_explanation,
+            "evidence_explanation": self.evidence_explanation,
+            "immediate_actions": list(self.immediate_actions),
+            "remediation_steps": list(self.remediation_steps),
+            "prevention_checklist": list(self.prevention_checklist),
+            "case_study": self.case_study.to_dict() if self.case_study else None,
+            "related_examples": list(self.related_examples),
+            "learning_resources": list(self.learning_resources),
+            "best_practices": list(self.best_practices),
+            "detail_level": self.detail_level,
+            "response_time": self.response_time
+        }
+
 
 class EducationalContentGenerator:
     """
@@ -90,7 +131,7 @@ class EducationalContentGenerator:
             patterns_path = Path(patterns_file)
         
         with open(patterns_path) as f:
-            self.patterns = json.load(f)
+            self.patterns = loads(f.read())
         
         # Load case studies
         if case_studies_file is None:
@@ -99,7 +140,7 @@ class EducationalContentGenerator:
             case_studies_path = Path(case_studies_file)
         
         with open(case_studies_path) as f:
-            case_study_data = json.load(f)
+            case_study_data = loads(f.read())
             self.case_studies = self._parse_case_studies(case_study_data)
         
         # Load additional educational content
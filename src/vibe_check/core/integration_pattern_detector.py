@@ -19,6 +19,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from pathlib import Path
 
+from ..utils.json_serialization import loads
 from .pattern_detector import PatternDetector, DetectionResult
 
 logger = logging.getLogger(__name__)
@@ -465,9 +466,8 @@ class IntegrationPatternDetector:
             # Load from the same file as base patterns
             patterns_path = Path(__file__).parent.parent.parent.parent / "data" / "anti_patterns.json"
             
-            import json
             with open(patterns_path) as f:
-                all_patterns = json.load(f)
+                all_patterns = loads(f.read())
             
             # Extract integration pattern data
             if "integration_over_engineering" in all_patterns:
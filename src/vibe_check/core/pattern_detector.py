@@ -8,16 +8,28 @@ with confidence scoring and educational content generation.
 The algorithms in this module achieved 87.5% accuracy in Phase 0 validation.
 """
 
-import json
+import logging
 import re
+import threading
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
+from ..utils.dataclass_utils import DATACLASS_SLOTS
+from ..utils.json_serialization import loads
 from .educational_content import EducationalContentGenerator, DetailLevel, EducationalResponse
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# Optional Hyperscan multi-pattern matching (single pass over text for all indicators)
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+
+@dataclass(**DATACLASS_SLOTS)
 class DetectionResult:
     """Result of anti-pattern detection"""
     pattern_type: str
@@ -47,7 +59,7 @@ class PatternDetector:
             patterns_path = Path(patterns_file)
         
         with open(patterns_path) as f:
-            pattern_data = json.load(f)
+            pattern_data = loads(f.read())
         
         # Extract version information if present
         self.schema_version = pattern_data.get("schema_version", "1.0.0")
@@ -66,7 +78,19 @@ class PatternDetector:
             case_studies_path = Path(case_studies_file)
         
         with open(case_studies_path) as f:
-            self.case_studies = json.load(f)
+            self.case_studies = loads(f.read())
+        
+        # Indicator regexes are compiled on first use and reused for every scan
+        self._compiled_indicators: Dict[str, Tuple[Dict[str, Any], list, list]] = {}
+        
+        # Hyperscan database over all indicators, built on first scan when available
+        self._multi_pattern_db = None
+        self._multi_pattern_keys: List[Tuple[str, bool, int]] = []
+        self._multi_pattern_disabled = not HYPERSCAN_AVAILABLE
+        self._multi_pattern_lock = threading.Lock()
+        # Hyperscan scratch space cannot be shared by concurrent scans, so each
+        # thread scanning with this detector gets its own
+        self._scan_scratch = threading.local()
         
         # Initialize educational content generator with comprehensive capabilities
         self.educational_generator = EducationalContentGenerator(
@@ -80,7 +104,8 @@ class PatternDetector:
         content: str,
         context: Optional[str] = None,
         focus_patterns: Optional[List[str]] = None,
-        detail_level: DetailLevel = DetailLevel.STANDARD
+        detail_level: DetailLevel = DetailLevel.STANDARD,
+        content_bytes: Optional[bytes] = None
     ) -> List[DetectionResult]:
         """
         Analyze text content for anti-patterns using validated algorithms.
@@ -92,21 +117,36 @@ class PatternDetector:
             content: Primary text to analyze (e.g., issue description)
             context: Additional context (e.g., issue title, comments)
             focus_patterns: Specific patterns to check (default: all patterns)
+            content_bytes: Optional UTF-8 encoding of content already computed by the
+                caller, reused for multi-pattern scanning instead of re-encoding
             
         Returns:
             List of DetectionResult objects for detected patterns
         """
         detected_patterns = []
         
-        # Combine content and context
+        # Combine content and context, lowercasing once for all patterns
         full_text = f"{content} {context or ''}"
+        full_text_lower = full_text.lower()
+        
+        # Match every indicator in one pass when Hyperscan is available. Matching is
+        # caseless, so for ASCII text the caller's bytes can be scanned as-is.
+        scan_bytes = None
+        if content_bytes is not None and full_text.isascii():
+            scan_bytes = b"".join((content_bytes, b" ", (context or "").encode("ascii")))
+        matched_indicators = self._scan_all_indicators(full_text_lower, scan_bytes)
         
         # Check each pattern type
         for pattern_id, pattern_config in self.patterns.items():
             if focus_patterns and pattern_id not in focus_patterns:
                 continue
             
-            result = self._detect_single_pattern(full_text, pattern_config)
+            result = self._detect_single_pattern(
+                full_text,
+                pattern_config,
+                text_lower=full_text_lower,
+                matched_indicators=matched_indicators
+            )
             
             if result.detected:
                 # Add enhanced educational content for detected patterns
@@ -148,28 +188,156 @@ class PatternDetector:
         
         return result
     
-    def _detect_single_pattern(self, text: str, pattern_config: Dict[str, Any]) -> DetectionResult:
+    def _get_compiled_indicators(self, pattern_config: Dict[str, Any]) -> Tuple[list, list]:
+        """
+        Get precompiled positive and negative indicators for a pattern config.
+        
+        Returns (positive, negative) lists of (compiled_regex, description, weight)
+        tuples. Results are cached by pattern id and rebuilt if a different config
+        object is passed for the same id.
+        """
+        pattern_id = pattern_config["id"]
+        cached = self._compiled_indicators.get(pattern_id)
+        if cached is not None and cached[0] is pattern_config:
+            return cached[1], cached[2]
+        
+        positive = [
+            (re.compile(indicator["regex"], re.IGNORECASE), indicator["description"], indicator["weight"])
+            for indicator in pattern_config["indicators"]
+        ]
+        negative = [
+            (re.compile(indicator["regex"], re.IGNORECASE), indicator.get("description"), indicator["weight"])
+            for indicator in pattern_config.get("negative_indicators", [])
+        ]
+        self._compiled_indicators[pattern_id] = (pattern_config, positive, negative)
+        return positive, negative
+    
+    def _get_multi_pattern_database(self):
+        """
+        Build (once) a Hyperscan database containing every indicator regex.
+        
+        Returns None when Hyperscan is unavailable or cannot compile one of the
+        indicator expressions; callers then fall back to per-regex matching.
+        """
+        if self._multi_pattern_disabled:
+            return None
+        if self._multi_pattern_db is not None:
+            return self._multi_pattern_db
+        
+        with self._multi_pattern_lock:
+            # Double-check locking pattern
+            if self._multi_pattern_disabled or self._multi_pattern_db is not None:
+                return self._multi_pattern_db
+            return self._build_multi_pattern_database()
+    
+    def _build_multi_pattern_database(self):
+        """Compile and publish the Hyperscan database (caller holds _multi_pattern_lock)"""
+        expressions = []
+        keys = []
+        for pattern_id, pattern_config in self.patterns.items():
+            for index, indicator in enumerate(pattern_config["indicators"]):
+                expressions.append(indicator["regex"].encode("utf-8"))
+                keys.append((pattern_id, False, index))
+            for index, indicator in enumerate(pattern_config.get("negative_indicators", [])):
+                expressions.append(indicator["regex"].encode("utf-8"))
+                keys.append((pattern_id, True, index))
+        
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=expressions,
+                ids=list(range(len(expressions))),
+                elements=len(expressions),
+                flags=[flags] * len(expressions)
+            )
+        except Exception as e:
+            logger.warning("Hyperscan compilation failed, using re fallback: %s", e)
+            self._multi_pattern_disabled = True
+            return None
+        
+        # Publish the keys first: readers that see the database use them unlocked
+        self._multi_pattern_keys = keys
+        self._multi_pattern_db = database
+        return database
+    
+    def _scan_all_indicators(self, text_lower: str, text_bytes: Optional[bytes] = None) -> Optional[set]:
+        """
+        Scan text once for all indicators using Hyperscan.
+        
+        text_bytes, when given, is scanned instead of encoding text_lower; it must be
+        the UTF-8 encoding of text equal to text_lower up to ASCII case.
+        
+        Returns a set of (pattern_id, is_negative, indicator_index) keys for matched
+        indicators, or None if multi-pattern scanning is unavailable.
+        """
+        database = self._get_multi_pattern_database()
+        if database is None:
+            return None
+        
+        keys = self._multi_pattern_keys
+        matched = set()
+        
+        def on_match(expression_id, start, end, flags, context):
+            matched.add(keys[expression_id])
+        
+        try:
+            if text_bytes is None:
+                text_bytes = text_lower.encode("utf-8", "surrogatepass")
+            scratch = getattr(self._scan_scratch, "scratch", None)
+            if scratch is None:
+                scratch = self._scan_scratch.scratch = hyperscan.Scratch(database)
+            database.scan(text_bytes, match_event_handler=on_match, scratch=scratch)
+        except Exception as e:
+            logger.warning("Hyperscan scan failed, using re fallback: %s", e)
+            return None
+        return matched
+    
+    def _detect_single_pattern(
+        self,
+        text: str,
+        pattern_config: Dict[str, Any],
+        text_lower: Optional[str] = None,
+        matched_indicators: Optional[set] = None
+    ) -> DetectionResult:
         """
         Detect a single anti-pattern using the validated algorithm from Phase 0.
         
         This method implements the exact detection logic that achieved 87.5% accuracy
         in comprehensive validation testing.
+        
+        Args:
+            text: Text to analyze
+            pattern_config: Pattern definition from the patterns file
+            text_lower: Optional pre-lowercased text, to avoid re-lowercasing per pattern
+            matched_indicators: Optional precomputed indicator matches from _scan_all_indicators
         """
         pattern_id = pattern_config["id"]
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
         evidence = []
         confidence = 0.0
         
+        positive_indicators, negative_indicators = self._get_compiled_indicators(pattern_config)
+        
         # Check positive indicators
-        for indicator in pattern_config["indicators"]:
-            if re.search(indicator["regex"], text_lower, re.IGNORECASE):
-                evidence.append(indicator["description"])
-                confidence += indicator["weight"]
+        for index, (regex, description, weight) in enumerate(positive_indicators):
+            if matched_indicators is not None:
+                is_match = (pattern_id, False, index) in matched_indicators
+            else:
+                is_match = regex.search(text_lower) is not None
+            if is_match:
+                evidence.append(description)
+                confidence += weight
         
         # Check negative indicators (reduce confidence if found)
-        for neg_indicator in pattern_config.get("negative_indicators", []):
-            if re.search(neg_indicator["regex"], text_lower, re.IGNORECASE):
-                confidence += neg_indicator["weight"]  # weight is negative
+        for index, (regex, _, weight) in enumerate(negative_indicators):
+            if matched_indicators is not None:
+                is_match = (pattern_id, True, index) in matched_indicators
+            else:
+                is_match = regex.search(text_lower) is not None
+            if is_match:
+                confidence += weight  # weight is negative
         
         # Ensure confidence is between 0 and 1
         confidence = max(0.0, min(1.0, confidence))
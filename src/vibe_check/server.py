@@ -13,12 +13,20 @@ Or programmatically:
     run_server()
 """
 
+import asyncio
+import atexit
+import functools
 import logging
 import os
+import queue
+import re
 import sys
-import argparse
 import secrets
-from typing import Dict, Any, Optional
+import signal
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+from pathlib import Path
+from typing import Dict, Any, Final, List, Optional
 
 try:
     from fastmcp import FastMCP
@@ -26,11 +34,9 @@ except ImportError:
     print("😅 FastMCP isn't vibing with us yet. Get it with: pip install fastmcp")
     sys.exit(1)
 
-from .tools.analyze_text_nollm import analyze_text_demo
+from .tools.analyze_text_nollm import analyze_text_demo, analyze_text_demo_async, analyze_texts_demo_async
 from .tools.analyze_issue_nollm import analyze_issue as analyze_github_issue_tool
 from .tools.analyze_pr_nollm import analyze_pr_nollm as analyze_pr_nollm_function
-from .tools.analyze_llm.tool_registry import register_llm_analysis_tools
-from .tools.diagnostics_claude_cli import register_diagnostic_tools
 from .tools.integration_decision_check import check_official_alternatives, analyze_integration_text, ValidationError, SCORING
 from .tools.integration_pattern_analysis import (
     analyze_integration_patterns_fast, 
@@ -38,67 +44,167 @@ from .tools.integration_pattern_analysis import (
     analyze_effort_complexity,
     enhance_text_analysis_with_integration_patterns
 )
-from .tools.pr_review import review_pull_request
 from .tools.vibe_mentor import get_mentor_engine, _generate_summary
-from .tools.config_validation import validate_configuration, format_validation_results, log_validation_results, register_config_validation_tools
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('vibe_check.log')
-    ]
-)
-logger = logging.getLogger(__name__)
+from .tools.config_validation import validate_configuration, format_validation_results, log_validation_results
+from .utils.json_serialization import serialize_tool_result, ORJSON_AVAILABLE
+from .utils.singleflight import singleflight
+
+# Configure logging: tool calls only enqueue records, and a background listener
+# thread does the stderr/file writes off the request path
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+# The log file is only opened on the first write
+_log_file_handler = logging.FileHandler('vibe_check.log', delay=True)
+# File writes are batched; WARNING and above, shutdown and SIGTERM flush immediately
+_log_file_buffer = MemoryHandler(capacity=64, flushLevel=logging.WARNING, target=_log_file_handler)
+_log_stream_handler = logging.StreamHandler()
+_log_handlers = [
+    _log_stream_handler,
+    _log_file_buffer
+]
+_log_queue_handler = QueueHandler(_log_queue)
+_log_listener: Optional[QueueListener] = None
+
+
+def _start_log_listener():
+    """Start the background thread draining the log queue into the real handlers"""
+    global _log_listener
+    _log_listener = QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+    _log_listener.start()
+
+
+def _stop_log_listener():
+    """Flush queued log records and stop the listener thread"""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+    _log_file_buffer.flush()
+
+
+def _log_directly_in_child():
+    """
+    Switch a forked child to unbuffered, in-thread logging.
+    
+    The listener thread does not survive fork, and pool workers exit via
+    os._exit without running atexit, so neither the queue nor the file
+    buffer would ever be drained in the child.
+    """
+    _root_logger.removeHandler(_log_queue_handler)
+    _root_logger.addHandler(_log_stream_handler)
+    _root_logger.addHandler(_log_file_handler)
 
-# Initialize FastMCP server
-mcp = FastMCP("Vibe Check MCP")
 
-# Register user diagnostic tools (essential for all users)
-register_diagnostic_tools(mcp)
+def _flush_logs_on_sigterm(signum, frame):
+    """Drain queued and buffered log records, then terminate as SIGTERM would"""
+    _stop_log_listener()
+    signal.signal(signum, signal.SIG_DFL)
+    os.kill(os.getpid(), signum)
 
-# Register configuration validation tools (Issue #98)
-register_config_validation_tools(mcp)
 
-# Register LLM-powered analysis tools
-register_llm_analysis_tools(mcp)
+_root_logger = logging.getLogger()
+if not _root_logger.handlers:  # same precondition as logging.basicConfig
+    _log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    for _handler in (*_log_handlers, _log_file_handler):
+        _handler.setFormatter(_log_formatter)
+    # The format uses no thread or multiprocessing fields; skip collecting them per record
+    logging.logThreads = False
+    logging.logMultiprocessing = False
+    _start_log_listener()
+    atexit.register(_stop_log_listener)
+    # SIGTERM (e.g. docker stop) skips atexit; flush before terminating, unless
+    # the host application already handles the signal
+    if (threading.current_thread() is threading.main_thread()
+            and signal.getsignal(signal.SIGTERM) == signal.SIG_DFL):
+        signal.signal(signal.SIGTERM, _flush_logs_on_sigterm)
+    # Buffered file records must not be written by both processes after fork
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(before=_log_file_buffer.flush, after_in_child=_log_directly_in_child)
+    _root_logger.addHandler(_log_queue_handler)
+    _root_logger.setLevel(logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Repository checkout root (src/vibe_check/server.py -> repo root)
+_PKG_ROOT = Path(__file__).resolve().parents[2]
+
+# Initialize FastMCP server (orjson tool result serialization when installed).
+# Tools defined in this module register on import; the diagnostic, config
+# validation, LLM and dev tool registrations are deferred to _build_mcp().
+# Exposed as `mcp` via module __getattr__ so `from vibe_check.server import mcp`
+# still returns the fully registered server.
+_mcp = FastMCP(
+    "Vibe Check MCP",
+    tool_serializer=serialize_tool_result if ORJSON_AVAILABLE else None
+)
 
-# Temporarily disable dev tools to test if they're causing the crash
 # Register development tools only when explicitly enabled via MCP config
 dev_mode_override = os.getenv("VIBE_CHECK_DEV_MODE_OVERRIDE") == "true"
-if dev_mode_override:
+# Resolved once at import; server_status reports against this snapshot
+_DEV_MODE_ENABLED: Final[bool] = os.getenv("VIBE_CHECK_DEV_MODE") == "true"
+
+
+def _load_dev_tools_module():
+    """Load the development test suite by file path, leaving sys.path untouched."""
+    import importlib.util
+    
+    path = _PKG_ROOT / "tests" / "integration" / "claude_cli_tests.py"
+    spec = importlib.util.spec_from_file_location("claude_cli_tests", path)
+    if spec is None or not path.is_file():
+        raise ImportError(f"No development test suite at {path}")
+    
+    module = importlib.util.module_from_spec(spec)
+    # Registered before execution, as pydantic models resolve their module by name
+    sys.modules[spec.name] = module
     try:
-        # Import development test suite from tests directory
-        import sys
-        from pathlib import Path
-        
-        # Add tests directory to path for importing
-        tests_dir = Path(__file__).parent.parent.parent / "tests"
-        if str(tests_dir) not in sys.path:
-            sys.path.insert(0, str(tests_dir))
-        
-        # Clear any cached imports to avoid circular import issues
-        import importlib
-        if 'integration.claude_cli_tests' in sys.modules:
-            importlib.reload(sys.modules['integration.claude_cli_tests'])
-            
-        from integration.claude_cli_tests import register_dev_tools
-        register_dev_tools(mcp)
-        logger.info("🔧 Dev mode enabled: Comprehensive testing tools available")
-        logger.info("   Available dev tools: test_claude_cli_integration, test_claude_cli_with_file_input,")
-        logger.info("                       test_claude_cli_comprehensive, test_claude_cli_mcp_permissions")
-    except ImportError as e:
-        logger.warning(f"⚠️ Dev tools not available: {e}")
-        logger.warning("   Set VIBE_CHECK_DEV_MODE=true and ensure tests/integration/claude_cli_tests.py exists")
-else:
-    logger.info("📦 User mode: Essential diagnostic tools only")
-    logger.info("   Dev tools disabled to prevent import conflicts in Claude Code")
-    logger.info("   To enable dev tools: set VIBE_CHECK_DEV_MODE_OVERRIDE=true")
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[spec.name]
+        raise
+    return module
+
+
+@functools.lru_cache(maxsize=1)
+def _build_mcp() -> FastMCP:
+    """Register the side-effectful tool sets once and return the server."""
+    from .tools.analyze_llm.tool_registry import register_llm_analysis_tools
+    from .tools.config_validation import register_config_validation_tools
+    from .tools.diagnostics_claude_cli import register_diagnostic_tools
+
+    # Register user diagnostic tools (essential for all users)
+    register_diagnostic_tools(_mcp)
+
+    # Register configuration validation tools (Issue #98)
+    register_config_validation_tools(_mcp)
+
+    # Register LLM-powered analysis tools
+    register_llm_analysis_tools(_mcp)
+
+    if dev_mode_override:
+        try:
+            _load_dev_tools_module().register_dev_tools(_mcp)
+            logger.info("🔧 Dev mode enabled: Comprehensive testing tools available")
+            logger.info("   Available dev tools: test_claude_cli_integration, test_claude_cli_with_file_input,")
+            logger.info("                       test_claude_cli_comprehensive, test_claude_cli_mcp_permissions")
+        except ImportError as e:
+            logger.warning("⚠️ Dev tools not available: %s", e)
+            logger.warning("   Set VIBE_CHECK_DEV_MODE=true and ensure tests/integration/claude_cli_tests.py exists")
+    else:
+        logger.info("📦 User mode: Essential diagnostic tools only")
+        logger.info("   Dev tools disabled to prevent import conflicts in Claude Code")
+        logger.info("   To enable dev tools: set VIBE_CHECK_DEV_MODE_OVERRIDE=true")
+
+    return _mcp
+
+
+def __getattr__(name: str) -> Any:
+    """Build and expose the MCP server lazily on first `mcp` access (PEP 562)."""
+    if name == "mcp":
+        return _build_mcp()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-@mcp.tool()
-def analyze_text_nollm(text: str, detail_level: str = "standard") -> Dict[str, Any]:
+
+@_mcp.tool()
+@singleflight
+async def analyze_text_nollm(text: str, detail_level: str = "standard") -> Dict[str, Any]:
     """
     🚀 Fast text analysis using direct pattern detection (no LLM calls).
 
@@ -116,16 +222,48 @@ def analyze_text_nollm(text: str, detail_level: str = "standard") -> Dict[str, A
 
     Args:
         text: Text content to analyze for anti-patterns
-        detail_level: Educational detail level (brief/standard/comprehensive)
+        detail_level: Educational detail level (brief/standard/comprehensive/none)
         
     Returns:
         Fast pattern detection analysis results
     """
-    logger.info(f"Fast text analysis requested for {len(text)} characters")
-    return analyze_text_demo(text, detail_level)
+    logger.info("Fast text analysis requested for %d characters", len(text))
+    return await analyze_text_demo_async(text, detail_level)
+
+@_mcp.tool()
+async def analyze_texts_nollm(texts: List[str], detail_level: str = "standard") -> List[Dict[str, Any]]:
+    """
+    🚀 Fast batch text analysis using direct pattern detection (no LLM calls).
+
+    Analyzes several snippets in one request, returning one result per text in order.
+    Each result has the same shape as analyze_text_nollm.
+
+    Use this tool for: "vibe check these files", "batch pattern analysis", "check several snippets"
+
+    Args:
+        texts: Text contents to analyze for anti-patterns
+        detail_level: Educational detail level (brief/standard/comprehensive/none)
+        
+    Returns:
+        List of fast pattern detection analysis results (a single error result
+        when the batch exceeds the text count or total size limit)
+    """
+    logger.info("Fast batch text analysis requested for %d texts", len(texts))
+    return await analyze_texts_demo_async(texts, detail_level)
+
+# GitHub "owner/repo" identifier; malformed values are rejected before any GitHub call
+_REPO_RX = re.compile(r"^[A-Za-z0-9._-]+/[A-Za-z0-9._-]+$")
 
-@mcp.tool()
-def analyze_issue_nollm(
+# Comment posting default per analysis mode when post_comment is not given
+_POST_COMMENT_BY_MODE = {"comprehensive": True, "quick": False, "standard": False}
+
+def _invalid_repository_message(repository: str) -> str:
+    """Describe a repository argument that is not in "owner/repo" form"""
+    return f"Invalid repository '{repository}': expected format \"owner/repo\""
+
+@_mcp.tool()
+@singleflight
+async def analyze_issue_nollm(
     issue_number: int, 
     repository: str = "kesslerio/vibe-check-mcp", 
     analysis_mode: str = "quick",
@@ -157,21 +295,34 @@ def analyze_issue_nollm(
     Returns:
         Fast GitHub issue analysis with basic recommendations
     """
+    if not _REPO_RX.match(repository):
+        return {
+            "error": _invalid_repository_message(repository),
+            "status": "vibe_check_error",
+            "issue_number": issue_number,
+            "repository": repository,
+            "friendly_error": "🚨 That repository doesn't look right. Use the \"owner/repo\" format."
+        }
+    
     # Auto-enable comment posting for comprehensive mode unless explicitly disabled
     if post_comment is None:
-        post_comment = (analysis_mode == "comprehensive")
+        post_comment = _POST_COMMENT_BY_MODE.get(analysis_mode, False)
     
-    logger.info(f"GitHub issue analysis ({analysis_mode}): #{issue_number} in {repository}")
-    return analyze_github_issue_tool(
+    logger.info("GitHub issue analysis (%s): #%s in %s", analysis_mode, issue_number, repository)
+    # PyGithub is blocking; run it on the default thread pool to keep the event loop free
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(
+        analyze_github_issue_tool,
         issue_number=issue_number,
         repository=repository, 
         analysis_mode=analysis_mode,
         detail_level=detail_level,
         post_comment=post_comment
-    )
+    ))
 
-@mcp.tool()
-def analyze_pr_nollm(
+@_mcp.tool()
+@singleflight
+async def analyze_pr_nollm(
     pr_number: int,
     repository: str = "kesslerio/vibe-check-mcp",
     analysis_mode: str = "quick",
@@ -202,15 +353,25 @@ def analyze_pr_nollm(
     Returns:
         Fast PR analysis with basic recommendations
     """
-    logger.info(f"Fast PR analysis requested: #{pr_number} in {repository} (mode: {analysis_mode})")
-    return analyze_pr_nollm_function(
+    if not _REPO_RX.match(repository):
+        return {
+            "success": False,
+            "error": _invalid_repository_message(repository),
+            "tool_type": "analyze_pr_nollm"
+        }
+    
+    logger.info("Fast PR analysis requested: #%s in %s (mode: %s)", pr_number, repository, analysis_mode)
+    # PyGithub is blocking; run it on the default thread pool to keep the event loop free
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(
+        analyze_pr_nollm_function,
         pr_number=pr_number,
         repository=repository,
         analysis_mode=analysis_mode,
         detail_level=detail_level
-    )
+    ))
 
-@mcp.tool()
+@_mcp.tool()
 async def review_pr_comprehensive(
     pr_number: int,
     repository: str = "kesslerio/vibe-check-mcp",
@@ -242,7 +403,9 @@ async def review_pr_comprehensive(
     Returns:
         Comprehensive PR analysis with file type breakdown and recommendations
     """
-    logger.info(f"🔍 Starting enhanced PR review for PR #{pr_number} with model: {model}")
+    logger.info("🔍 Starting enhanced PR review for PR #%s with model: %s", pr_number, model)
+    
+    from .tools.pr_review import review_pull_request
     
     return await review_pull_request(
         pr_number=pr_number,
@@ -253,7 +416,29 @@ async def review_pr_comprehensive(
         model=model
     )
 
-@mcp.tool()
+# Separator for comma-separated custom_features arguments
+_FEATURE_SPLIT = re.compile(r"\s*,\s*")
+
+def _parse_features(custom_features: str) -> List[str]:
+    """Split a comma-separated feature string into interned, non-empty names"""
+    return [sys.intern(f) for f in _FEATURE_SPLIT.split(custom_features.strip()) if f]
+
+def _integration_error(technology: str, message: str, recommendation: Optional[str] = None) -> Dict[str, Any]:
+    """Error response shared by the integration tools"""
+    response = {"status": "error", "message": message, "technology": technology}
+    if recommendation is not None:
+        response["recommendation"] = recommendation
+    return response
+
+def _empty_technology_response(technology: str) -> Dict[str, Any]:
+    """Error response for a missing technology name, returned before any analysis work"""
+    return _integration_error(
+        technology,
+        "Input validation failed: Technology name cannot be empty",
+        "Please check your input parameters"
+    )
+
+@_mcp.tool()
 def check_integration_alternatives(
     technology: str,
     custom_features: str,
@@ -283,50 +468,37 @@ def check_integration_alternatives(
     Returns:
         Integration recommendation with research requirements and next steps
     """
-    logger.info(f"Integration decision check for {technology}: {custom_features}")
+    if not technology or not technology.strip():
+        return _empty_technology_response(technology)
+    
+    logger.info("Integration decision check for %s: %s", technology, custom_features)
     
     try:
         # Parse custom features from comma-separated string
-        features_list = [f.strip() for f in custom_features.split(",") if f.strip()]
+        features_list = _parse_features(custom_features)
         
         # Get recommendation
         recommendation = check_official_alternatives(technology, features_list)
         
         # Convert dataclass to dict for JSON serialization
-        result = {
+        return {
             "status": "success",
-            "technology": recommendation.technology,
-            "warning_level": recommendation.warning_level,
-            "official_solutions": recommendation.official_solutions,
-            "custom_justification_needed": recommendation.custom_justification_needed,
-            "research_required": recommendation.research_required,
-            "red_flags_detected": recommendation.red_flags_detected,
-            "decision_matrix": recommendation.decision_matrix,
-            "next_steps": recommendation.next_steps,
-            "recommendation": recommendation.recommendation,
+            **recommendation.to_dict(),
             "description": description
         }
         
-        return result
-        
     except ValidationError as e:
-        logger.warning(f"Input validation failed: {e}")
-        return {
-            "status": "error",
-            "message": f"Input validation failed: {str(e)}",
-            "technology": technology,
-            "recommendation": "Please check your input parameters"
-        }
+        logger.warning("Input validation failed: %s", e)
+        return _integration_error(
+            technology, f"Input validation failed: {e}", "Please check your input parameters"
+        )
     except Exception as e:
-        logger.error(f"Integration decision check failed: {e}")
-        return {
-            "status": "error",
-            "message": f"Integration analysis failed: {str(e)}",
-            "technology": technology,
-            "recommendation": "Manual research required due to analysis error"
-        }
+        logger.error("Integration decision check failed: %s", e)
+        return _integration_error(
+            technology, f"Integration analysis failed: {e}", "Manual research required due to analysis error"
+        )
 
-@mcp.tool()
+@_mcp.tool()
 def analyze_integration_decision_text(
     text: str,
     detail_level: str = "standard"
@@ -353,7 +525,7 @@ def analyze_integration_decision_text(
     Returns:
         Analysis of detected technologies and integration recommendations
     """
-    logger.info(f"Integration decision text analysis for {len(text)} characters")
+    logger.info("Integration decision text analysis for %d characters", len(text))
     
     try:
         analysis = analyze_integration_text(text)
@@ -397,14 +569,79 @@ def analyze_integration_decision_text(
         return result
         
     except Exception as e:
-        logger.error(f"Integration decision text analysis failed: {e}")
+        logger.error("Integration decision text analysis failed: %s", e)
         return {
             "status": "error",
             "message": f"Text analysis failed: {str(e)}",
             "text_length": len(text)
         }
 
-@mcp.tool()
+# Static parts of the integration decision framework (leaf lists are tuples so
+# they can be shared across responses; they serialize as JSON arrays)
+_OFFICIAL_OPTION_DETAILS = {
+    "pros": (
+        "Vendor maintained and supported",
+        "Production ready and tested",
+        "Security updates included",
+        "Minimal development time",
+        "Community documentation"
+    ),
+    "cons": (
+        "Less customization control",
+        "Potential feature limitations",
+        "Dependency on vendor roadmap"
+    ),
+    "effort_score": 2,
+    "risk_score": 1,
+    "maintenance_score": 1
+}
+
+_CUSTOM_OPTION_DETAILS = {
+    "pros": (
+        "Full control over implementation",
+        "Exact requirement matching",
+        "No vendor dependencies"
+    ),
+    "cons": (
+        "High development time",
+        "Ongoing maintenance burden",
+        "Security responsibility",
+        "Documentation overhead",
+        "Testing complexity"
+    ),
+    "effort_score": 8,
+    "risk_score": 6,
+    "maintenance_score": 8
+}
+
+_CRITERIA_WEIGHTS = {
+    "development_time": 0.25,
+    "maintenance_burden": 0.30,
+    "reliability_support": 0.25,
+    "customization_needs": 0.20
+}
+
+_RISK_ASSESSMENT = {
+    "official_solution_risks": (
+        "Vendor discontinuation (Low probability)",
+        "Feature gaps for requirements (Medium probability)",
+        "Breaking changes in updates (Low probability)"
+    ),
+    "custom_development_risks": (
+        "Development timeline overrun (High probability)",
+        "Security vulnerabilities (Medium probability)",
+        "Maintenance neglect over time (High probability)",
+        "Knowledge silos and team dependencies (Medium probability)"
+    )
+}
+
+_CLEAR_THOUGHT_VALIDATION_STEPS = (
+    "Document specific gaps that justify custom development",
+    "Estimate total cost of ownership for both approaches",
+    "Consider team expertise and long-term maintenance"
+)
+
+@_mcp.tool()
 def integration_decision_framework(
     technology: str,
     custom_features: str,
@@ -435,11 +672,14 @@ def integration_decision_framework(
     Returns:
         Comprehensive decision framework with recommendations and next steps
     """
-    logger.info(f"Integration decision framework for {technology}: {analysis_type}")
+    if not technology or not technology.strip():
+        return _empty_technology_response(technology)
+    
+    logger.info("Integration decision framework for %s: %s", technology, analysis_type)
     
     try:
         # First get the basic integration analysis
-        features_list = [f.strip() for f in custom_features.split(",") if f.strip()]
+        features_list = _parse_features(custom_features)
         recommendation = check_official_alternatives(technology, features_list)
         
         # Generate decision statement if not provided
@@ -462,48 +702,15 @@ def integration_decision_framework(
                 {
                     "option": "Official Solution",
                     "description": f"Use official {technology} container/SDK",
-                    "pros": [
-                        "Vendor maintained and supported",
-                        "Production ready and tested",
-                        "Security updates included",
-                        "Minimal development time",
-                        "Community documentation"
-                    ],
-                    "cons": [
-                        "Less customization control",
-                        "Potential feature limitations",
-                        "Dependency on vendor roadmap"
-                    ],
-                    "effort_score": 2,
-                    "risk_score": 1,
-                    "maintenance_score": 1
+                    **_OFFICIAL_OPTION_DETAILS
                 },
                 {
                     "option": "Custom Development",
                     "description": f"Build custom {technology} integration",
-                    "pros": [
-                        "Full control over implementation",
-                        "Exact requirement matching",
-                        "No vendor dependencies"
-                    ],
-                    "cons": [
-                        "High development time",
-                        "Ongoing maintenance burden",
-                        "Security responsibility",
-                        "Documentation overhead",
-                        "Testing complexity"
-                    ],
-                    "effort_score": 8,
-                    "risk_score": 6,
-                    "maintenance_score": 8
+                    **_CUSTOM_OPTION_DETAILS
                 }
             ],
-            "criteria_weights": {
-                "development_time": 0.25,
-                "maintenance_burden": 0.30,
-                "reliability_support": 0.25,
-                "customization_needs": 0.20
-            },
+            "criteria_weights": dict(_CRITERIA_WEIGHTS),
             "recommendation": recommendation.recommendation,
             "next_steps": recommendation.next_steps
         }
@@ -513,19 +720,7 @@ def integration_decision_framework(
             framework["scoring_matrix"] = SCORING
         
         elif analysis_type == "risk-analysis":
-            framework["risk_assessment"] = {
-                "official_solution_risks": [
-                    "Vendor discontinuation (Low probability)",
-                    "Feature gaps for requirements (Medium probability)",
-                    "Breaking changes in updates (Low probability)"
-                ],
-                "custom_development_risks": [
-                    "Development timeline overrun (High probability)",
-                    "Security vulnerabilities (Medium probability)",
-                    "Maintenance neglect over time (High probability)",
-                    "Knowledge silos and team dependencies (Medium probability)"
-                ]
-            }
+            framework["risk_assessment"] = dict(_RISK_ASSESSMENT)
         
         # Add Clear Thought integration guidance
         framework["clear_thought_integration"] = {
@@ -535,24 +730,19 @@ def integration_decision_framework(
             "complexity_check": "Is custom development truly necessary or driven by assumptions?",
             "validation_steps": [
                 f"Test official {technology} solution with actual requirements",
-                "Document specific gaps that justify custom development",
-                "Estimate total cost of ownership for both approaches",
-                "Consider team expertise and long-term maintenance"
+                *_CLEAR_THOUGHT_VALIDATION_STEPS
             ]
         }
         
         return framework
         
     except Exception as e:
-        logger.error(f"Integration decision framework failed: {e}")
-        return {
-            "status": "error",
-            "message": f"Decision framework analysis failed: {str(e)}",
-            "technology": technology,
-            "recommendation": "Manual decision analysis required due to error"
-        }
+        logger.error("Integration decision framework failed: %s", e)
+        return _integration_error(
+            technology, f"Decision framework analysis failed: {e}", "Manual decision analysis required due to error"
+        )
 
-@mcp.tool()
+@_mcp.tool()
 def integration_research_with_websearch(
     technology: str,
     custom_features: str,
@@ -582,11 +772,14 @@ def integration_research_with_websearch(
     Returns:
         Enhanced integration recommendation with web-researched information
     """
-    logger.info(f"Enhanced integration research for {technology} with web search")
+    if not technology or not technology.strip():
+        return _empty_technology_response(technology)
+    
+    logger.info("Enhanced integration research for %s with web search", technology)
     
     try:
         # Parse custom features
-        features_list = [f.strip() for f in custom_features.split(",") if f.strip()]
+        features_list = _parse_features(custom_features)
         
         # Perform web search for technology information
         search_results = {}
@@ -613,7 +806,7 @@ def integration_research_with_websearch(
             enhanced_info["web_findings"] = search_results
             
         except Exception as search_error:
-            logger.warning(f"Web search execution failed: {search_error}")
+            logger.warning("Web search execution failed: %s", search_error)
             enhanced_info["web_findings"]["search_error"] = str(search_error)
             # Fallback to search methodology guidance
             enhanced_info["web_findings"]["fallback_guidance"] = {
@@ -637,11 +830,7 @@ def integration_research_with_websearch(
                 "recommendation": base_recommendation.recommendation
             }
         except ValidationError as e:
-            return {
-                "status": "error",
-                "message": f"Input validation failed: {str(e)}",
-                "technology": technology
-            }
+            return _integration_error(technology, f"Input validation failed: {e}")
         
         # Enhance recommendations with web search insights
         enhanced_info["enhanced_recommendations"] = [
@@ -673,15 +862,12 @@ def integration_research_with_websearch(
         return enhanced_info
         
     except Exception as e:
-        logger.error(f"Enhanced integration research failed: {e}")
-        return {
-            "status": "error", 
-            "message": f"Research failed: {str(e)}",
-            "technology": technology,
-            "recommendation": "Perform manual research using search methodology"
-        }
+        logger.error("Enhanced integration research failed: %s", e)
+        return _integration_error(
+            technology, f"Research failed: {e}", "Perform manual research using search methodology"
+        )
 
-@mcp.tool()
+@_mcp.tool()
 def analyze_integration_patterns(
     content: str,
     context: str = "",
@@ -710,7 +896,7 @@ def analyze_integration_patterns(
     Returns:
         Real-time integration pattern analysis with actionable recommendations
     """
-    logger.info(f"Integration pattern analysis for {len(content)} characters")
+    logger.info("Integration pattern analysis for %d characters", len(content))
     
     return analyze_integration_patterns_fast(
         content=content,
@@ -718,7 +904,7 @@ def analyze_integration_patterns(
         detail_level=detail_level
     )
 
-@mcp.tool()
+@_mcp.tool()
 def quick_tech_scan(content: str) -> Dict[str, Any]:
     """
     ⚡ Ultra-Fast Technology Scan for Immediate Feedback.
@@ -745,7 +931,7 @@ def quick_tech_scan(content: str) -> Dict[str, Any]:
     
     return quick_technology_scan(content)
 
-@mcp.tool()
+@_mcp.tool()
 def analyze_integration_effort(
     content: str,
     lines_added: int = 0,
@@ -791,7 +977,7 @@ def analyze_integration_effort(
         pr_metrics=pr_metrics
     )
 
-@mcp.tool()
+@_mcp.tool()
 def analyze_doom_loops(
     content: str,
     context: str = "",
@@ -820,7 +1006,7 @@ def analyze_doom_loops(
     Returns:
         Doom loop analysis with intervention recommendations
     """
-    logger.info(f"Doom loop analysis requested for {len(content)} characters")
+    logger.info("Doom loop analysis requested for %d characters", len(content))
     
     try:
         from .tools.doom_loop_analysis import analyze_text_for_doom_loops, get_session_health_analysis
@@ -869,7 +1055,7 @@ def analyze_doom_loops(
         return result
         
     except Exception as e:
-        logger.error(f"Doom loop analysis failed: {e}")
+        logger.error("Doom loop analysis failed: %s", e)
         return {
             "status": "error",
             "error": str(e),
@@ -880,7 +1066,7 @@ def analyze_doom_loops(
             ]
         }
 
-@mcp.tool()
+@_mcp.tool()
 def session_health_check() -> Dict[str, Any]:
     """
     🏥 MCP Session Health and Productivity Analysis.
@@ -942,14 +1128,14 @@ def session_health_check() -> Dict[str, Any]:
         return health_report
         
     except Exception as e:
-        logger.error(f"Session health check failed: {e}")
+        logger.error("Session health check failed: %s", e)
         return {
             "status": "error",
             "error": str(e),
             "message": "Health check failed - assume session is healthy and continue working"
         }
 
-@mcp.tool()
+@_mcp.tool()
 def productivity_intervention() -> Dict[str, Any]:
     """
     🆘 Emergency Productivity Intervention and Loop Breaking.
@@ -995,7 +1181,7 @@ def productivity_intervention() -> Dict[str, Any]:
         return intervention
         
     except Exception as e:
-        logger.error(f"Productivity intervention failed: {e}")
+        logger.error("Productivity intervention failed: %s", e)
         return {
             "status": "emergency_fallback",
             "message": "🆘 INTERVENTION ACTIVATED",
@@ -1007,7 +1193,7 @@ def productivity_intervention() -> Dict[str, Any]:
             ]
         }
 
-@mcp.tool()
+@_mcp.tool()
 def reset_session_tracking() -> Dict[str, Any]:
     """
     🔄 Reset Session Tracking for Fresh Start.
@@ -1045,7 +1231,7 @@ def reset_session_tracking() -> Dict[str, Any]:
         return reset_result
         
     except Exception as e:
-        logger.error(f"Session reset failed: {e}")
+        logger.error("Session reset failed: %s", e)
         return {
             "status": "manual_reset",
             "message": "✅ Consider this a fresh start - track your own productivity",
@@ -1080,7 +1266,7 @@ def _get_phase_affirmation(phase: str, query: str) -> str:
     else:
         return phase_affirmations[phase][2]
 
-@mcp.tool()
+@_mcp.tool()
 def vibe_check_mentor(
     query: str,
     context: Optional[str] = None,
@@ -1131,7 +1317,7 @@ def vibe_check_mentor(
     Returns:
         Collaborative reasoning analysis with multi-perspective insights or quick interrupt
     """
-    logger.info(f"Vibe mentor activated: mode={mode}, depth={reasoning_depth}, phase={phase} for query: {query[:100]}...")
+    logger.info("Vibe mentor activated: mode=%s, depth=%s, phase=%s for query: %s...", mode, reasoning_depth, phase, query[:100])
     
     try:
         # Get mentor engine instance
@@ -1179,14 +1365,14 @@ def vibe_check_mentor(
                     
                     if len(diff_data) > max_diff_size:
                         diff_data = diff_data[:max_diff_size] + f"\n\n[TRUNCATED: Diff too large ({len(diff_result.data)} chars). Showing first {max_diff_size} characters for performance.]"
-                        logger.info(f"Truncated large diff for PR #{pr_number} ({len(diff_result.data)} chars -> {max_diff_size} chars)")
+                        logger.info("Truncated large diff for PR #%s (%d chars -> %s chars)", pr_number, len(diff_result.data), max_diff_size)
                     
                     pr_diff_content = f"\n\n**ACTUAL PR DIFF (ISSUE #151 FIX):**\n{diff_data}"
-                    logger.info(f"Successfully fetched diff for PR #{pr_number} in {repository}")
+                    logger.info("Successfully fetched diff for PR #%s in %s", pr_number, repository)
                 else:
-                    logger.warning(f"Failed to fetch PR diff: {diff_result.error}")
+                    logger.warning("Failed to fetch PR diff: %s", diff_result.error)
             except Exception as e:
-                logger.warning(f"Error fetching PR diff: {e}")
+                logger.warning("Error fetching PR diff: %s", e)
         
         # Include PR diff in analysis if found
         enhanced_text = combined_text + pr_diff_content
@@ -1335,7 +1521,7 @@ def vibe_check_mentor(
         return response
         
     except Exception as e:
-        logger.error(f"Vibe mentor error: {e}", exc_info=True)
+        logger.error("Vibe mentor error: %s", e, exc_info=True)
         return {
             "status": "error",
             "message": f"Mentoring session failed: {str(e)}",
@@ -1347,7 +1533,83 @@ def vibe_check_mentor(
         }
 
 
-@mcp.tool()
+# Static parts of the server_status response
+_CORE_TOOLS = (
+    "analyze_text_demo - Demo anti-pattern analysis",
+    "analyze_texts_nollm - Batch fast anti-pattern analysis for multiple texts",
+    "analyze_github_issue - GitHub issue analysis (Issue #22 ✅ COMPLETE)",
+    "review_pull_request - Comprehensive PR review (Issue #35 ✅ COMPLETE)",
+    "claude_cli_status - Essential: Check Claude CLI availability and version",
+    "claude_cli_diagnostics - Essential: Diagnose Claude CLI timeout and recursion issues",
+    "validate_mcp_configuration - Comprehensive Claude CLI and MCP configuration validation (Issue #98 ✅ COMPLETE)",
+    "check_claude_cli_integration - Quick Claude CLI integration health check (Issue #98 ✅ COMPLETE)",
+    "analyze_text_llm - Claude CLI content analysis with LLM reasoning",
+    "analyze_pr_llm - Claude CLI PR review with comprehensive analysis",
+    "analyze_code_llm - Claude CLI code analysis for anti-patterns",
+    "analyze_issue_llm - Claude CLI issue analysis with specialized prompts",
+    "analyze_github_issue_llm - GitHub issue vibe check with Claude CLI reasoning",
+    "analyze_github_pr_llm - GitHub PR vibe check with comprehensive Claude CLI analysis",
+    "analyze_llm_status - Status check for Claude CLI integration",
+    "check_integration_alternatives - Official alternative check for integration decisions (Issue #113 ✅ COMPLETE)",
+    "analyze_integration_decision_text - Text analysis for integration anti-patterns (Issue #113 ✅ COMPLETE)",
+    "integration_decision_framework - Structured decision framework with Clear Thought integration (Issue #113 ✅ COMPLETE)",
+    "integration_research_with_websearch - Enhanced integration research with real-time web search (Issue #113 ✅ COMPLETE)",
+    "analyze_integration_patterns - Fast integration pattern detection for vibe coding safety net (Issue #112 ✅ COMPLETE)",
+    "quick_tech_scan - Ultra-fast technology scan for immediate feedback (Issue #112 ✅ COMPLETE)",
+    "analyze_integration_effort - Integration effort-complexity analysis (Issue #112 ✅ COMPLETE)",
+    "analyze_doom_loops - AI doom loop and analysis paralysis detection (Issue #116 ⚡ NEW)",
+    "session_health_check - MCP session health and productivity analysis (Issue #116 ⚡ NEW)", 
+    "productivity_intervention - Emergency productivity intervention and loop breaking (Issue #116 ⚡ NEW)",
+    "reset_session_tracking - Reset session tracking for fresh start (Issue #116 ⚡ NEW)",
+    "vibe_check_mentor - Senior engineer collaborative reasoning with multi-persona feedback (Issue #126 🔥 LATEST)",
+    "server_status - Server status and capabilities"
+)
+
+_DEV_TOOLS = (
+    "test_claude_cli_integration - Dev: Test Claude CLI integration via MCP",
+    "test_claude_cli_with_file_input - Dev: Test Claude CLI with file input", 
+    "test_claude_cli_comprehensive - Dev: Comprehensive test suite with multiple scenarios",
+    "test_claude_cli_mcp_permissions - Dev: Test Claude CLI with MCP permissions bypass"
+)
+
+if _DEV_MODE_ENABLED:
+    _AVAILABLE_TOOLS = _CORE_TOOLS + _DEV_TOOLS
+    _TOOL_MODE_STR = "🔧 Development Mode (VIBE_CHECK_DEV_MODE=true)"
+    _TOOL_COUNT_STR = f"{len(_CORE_TOOLS)} core + {len(_DEV_TOOLS)} dev tools"
+else:
+    _AVAILABLE_TOOLS = _CORE_TOOLS
+    _TOOL_MODE_STR = "📦 User Mode (essential tools only)"
+    _TOOL_COUNT_STR = f"{len(_CORE_TOOLS)} essential tools"
+
+_ARCHITECTURE_IMPROVEMENT = {
+    "issue_72_status": "✅ COMPLETE",
+    "essential_diagnostics": "✅ COMPLETE - claude_cli_status, claude_cli_diagnostics",
+    "environment_based_dev_tools": "✅ COMPLETE - VIBE_CHECK_DEV_MODE support", 
+    "legacy_cleanup": "✅ COMPLETE - Clean tool registration architecture",
+    "tool_reduction_achieved": "6 testing tools → 2 essential user diagnostics (67% reduction)"
+}
+
+_CORE_ENGINE_STATUS = {
+    "validation_completed": True,
+    "detection_accuracy": "87.5%",
+    "false_positive_rate": "0%",
+    "patterns_supported": 4,
+    "phase_1_complete": True
+}
+
+_DEV_MODE_INSTRUCTIONS = {
+    "enable_dev_tools": "export VIBE_CHECK_DEV_MODE=true",
+    "dev_tools_location": "tests/integration/claude_cli_tests.py",
+    "user_essential_tools": ("claude_cli_status", "claude_cli_diagnostics")
+}
+
+_UPCOMING_TOOLS = (
+    "analyze_code - Code content analysis (Issue #23)", 
+    "validate_integration - Integration approach validation (Issue #24)",
+    "explain_pattern - Pattern education and guidance (Issue #25)"
+)
+
+@_mcp.tool()
 def server_status() -> Dict[str, Any]:
     """
     Get Vibe Check MCP server status and capabilities.
@@ -1355,99 +1617,35 @@ def server_status() -> Dict[str, Any]:
     Returns:
         Server status, core engine validation results, and available capabilities
     """
-    # Check if dev mode is enabled
-    dev_mode_enabled = os.getenv("VIBE_CHECK_DEV_MODE") == "true"
-    
-    # Core tools always available
-    core_tools = [
-        "analyze_text_demo - Demo anti-pattern analysis",
-        "analyze_github_issue - GitHub issue analysis (Issue #22 ✅ COMPLETE)",
-        "review_pull_request - Comprehensive PR review (Issue #35 ✅ COMPLETE)",
-        "claude_cli_status - Essential: Check Claude CLI availability and version",
-        "claude_cli_diagnostics - Essential: Diagnose Claude CLI timeout and recursion issues",
-        "validate_mcp_configuration - Comprehensive Claude CLI and MCP configuration validation (Issue #98 ✅ COMPLETE)",
-        "check_claude_cli_integration - Quick Claude CLI integration health check (Issue #98 ✅ COMPLETE)",
-        "analyze_text_llm - Claude CLI content analysis with LLM reasoning",
-        "analyze_pr_llm - Claude CLI PR review with comprehensive analysis",
-        "analyze_code_llm - Claude CLI code analysis for anti-patterns",
-        "analyze_issue_llm - Claude CLI issue analysis with specialized prompts",
-        "analyze_github_issue_llm - GitHub issue vibe check with Claude CLI reasoning",
-        "analyze_github_pr_llm - GitHub PR vibe check with comprehensive Claude CLI analysis",
-        "analyze_llm_status - Status check for Claude CLI integration",
-        "check_integration_alternatives - Official alternative check for integration decisions (Issue #113 ✅ COMPLETE)",
-        "analyze_integration_decision_text - Text analysis for integration anti-patterns (Issue #113 ✅ COMPLETE)",
-        "integration_decision_framework - Structured decision framework with Clear Thought integration (Issue #113 ✅ COMPLETE)",
-        "integration_research_with_websearch - Enhanced integration research with real-time web search (Issue #113 ✅ COMPLETE)",
-        "analyze_integration_patterns - Fast integration pattern detection for vibe coding safety net (Issue #112 ✅ COMPLETE)",
-        "quick_tech_scan - Ultra-fast technology scan for immediate feedback (Issue #112 ✅ COMPLETE)",
-        "analyze_integration_effort - Integration effort-complexity analysis (Issue #112 ✅ COMPLETE)",
-        "analyze_doom_loops - AI doom loop and analysis paralysis detection (Issue #116 ⚡ NEW)",
-        "session_health_check - MCP session health and productivity analysis (Issue #116 ⚡ NEW)", 
-        "productivity_intervention - Emergency productivity intervention and loop breaking (Issue #116 ⚡ NEW)",
-        "reset_session_tracking - Reset session tracking for fresh start (Issue #116 ⚡ NEW)",
-        "vibe_check_mentor - Senior engineer collaborative reasoning with multi-persona feedback (Issue #126 🔥 LATEST)",
-        "server_status - Server status and capabilities"
-    ]
-    
-    # Development tools (environment-based)
-    dev_tools = [
-        "test_claude_cli_integration - Dev: Test Claude CLI integration via MCP",
-        "test_claude_cli_with_file_input - Dev: Test Claude CLI with file input", 
-        "test_claude_cli_comprehensive - Dev: Comprehensive test suite with multiple scenarios",
-        "test_claude_cli_mcp_permissions - Dev: Test Claude CLI with MCP permissions bypass"
-    ]
-    
-    # Build available tools list
-    available_tools = core_tools[:]
-    
-    if dev_mode_enabled:
-        available_tools.extend(dev_tools)
-        tool_mode = "🔧 Development Mode (VIBE_CHECK_DEV_MODE=true)"
-        tool_count = f"{len(core_tools)} core + {len(dev_tools)} dev tools"
-    else:
-        tool_mode = "📦 User Mode (essential tools only)"
-        tool_count = f"{len(core_tools)} essential tools"
-    
     return {
         "server_name": "Vibe Check MCP",
         "version": "Phase 2.2 - Testing Tools Architecture (Issue #72 ✅ COMPLETE)",
         "status": "✅ Operational",
-        "tool_mode": tool_mode,
-        "tool_count": tool_count,
-        "architecture_improvement": {
-            "issue_72_status": "✅ COMPLETE",
-            "essential_diagnostics": "✅ COMPLETE - claude_cli_status, claude_cli_diagnostics",
-            "environment_based_dev_tools": "✅ COMPLETE - VIBE_CHECK_DEV_MODE support", 
-            "legacy_cleanup": "✅ COMPLETE - Clean tool registration architecture",
-            "tool_reduction_achieved": "6 testing tools → 2 essential user diagnostics (67% reduction)"
-        },
-        "core_engine_status": {
-            "validation_completed": True,
-            "detection_accuracy": "87.5%",
-            "false_positive_rate": "0%",
-            "patterns_supported": 4,
-            "phase_1_complete": True
-        },
-        "available_tools": available_tools,
-        "dev_mode_instructions": {
-            "enable_dev_tools": "export VIBE_CHECK_DEV_MODE=true",
-            "dev_tools_location": "tests/integration/claude_cli_tests.py",
-            "user_essential_tools": ["claude_cli_status", "claude_cli_diagnostics"]
-        },
-        "upcoming_tools": [
-            "analyze_code - Code content analysis (Issue #23)", 
-            "validate_integration - Integration approach validation (Issue #24)",
-            "explain_pattern - Pattern education and guidance (Issue #25)"
-        ],
+        "tool_mode": _TOOL_MODE_STR,
+        "tool_count": _TOOL_COUNT_STR,
+        "architecture_improvement": dict(_ARCHITECTURE_IMPROVEMENT),
+        "core_engine_status": dict(_CORE_ENGINE_STATUS),
+        "available_tools": list(_AVAILABLE_TOOLS),
+        "dev_mode_instructions": dict(_DEV_MODE_INSTRUCTIONS),
+        "upcoming_tools": list(_UPCOMING_TOOLS),
         "anti_pattern_prevention": "✅ Successfully applied in our own development"
     }
 
+# Transport modes accepted from MCP_TRANSPORT and --transport
+_VALID_TRANSPORTS = ("stdio", "streamable-http")
+
+@functools.lru_cache(maxsize=1)
 def detect_transport_mode() -> str:
-    """Auto-detect the best transport mode based on environment."""
+    """
+    Auto-detect the best transport mode based on environment.
+    
+    The environment does not change after startup, so the result is computed
+    once per process (detect_transport_mode.cache_clear() re-reads it).
+    """
     # Check for explicit transport override first
     transport_override = os.environ.get("MCP_TRANSPORT")
-    if transport_override in ["stdio", "streamable-http"]:
-        logger.info(f"Transport override found: Using '{transport_override}' from MCP_TRANSPORT env var.")
+    if transport_override in _VALID_TRANSPORTS:
+        logger.info("Transport override found: Using '%s' from MCP_TRANSPORT env var.", transport_override)
         return transport_override
 
     # Check if running in Docker, which strongly implies an HTTP server is needed.
@@ -1493,7 +1691,7 @@ def run_server(transport: Optional[str] = None, host: Optional[str] = None, port
         # Log success
         warnings = [r for r in validation_results if not r.success and r.level.value == "warning"]
         if warnings:
-            logger.warning(f"⚠️ Configuration validation completed with {len(warnings)} warnings")
+            logger.warning("⚠️ Configuration validation completed with %d warnings", len(warnings))
         else:
             logger.info("✅ Configuration validation passed - all systems ready")
         
@@ -1504,6 +1702,7 @@ def run_server(transport: Optional[str] = None, host: Optional[str] = None, port
         # Determine transport mode
         transport_mode = transport or detect_transport_mode()
         
+        mcp = _build_mcp()
         if transport_mode == "stdio":
             logger.info("🔗 Using stdio transport for Claude Desktop/Code integration")
             mcp.run()  # Uses stdio by default
@@ -1511,23 +1710,25 @@ def run_server(transport: Optional[str] = None, host: Optional[str] = None, port
             # HTTP transport for Docker/server deployment
             server_host = host or os.environ.get("MCP_SERVER_HOST", "0.0.0.0")
             server_port = port or int(os.environ.get("MCP_SERVER_PORT", "8001"))
-            logger.info(f"🌐 Using streamable-http transport on http://{server_host}:{server_port}/mcp")
+            logger.info("🌐 Using streamable-http transport on http://%s:%s/mcp", server_host, server_port)
             mcp.run(transport="streamable-http", host=server_host, port=server_port)
         
     except KeyboardInterrupt:
         logger.info("🛑 Server shutdown requested by user")
     except Exception as e:
-        logger.error(f"❌ Server startup failed: {e}")
+        logger.error("❌ Server startup failed: %s", e)
         sys.exit(1)
     finally:
         logger.info("✅ Vibe Check MCP server shutdown complete")
 
-def main():
-    """Entry point for direct server execution with CLI argument support."""
+def _build_parser():
+    """Build the CLI argument parser (argparse is only imported when flags are given)."""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="Vibe Check MCP Server")
     parser.add_argument(
         "--transport", 
-        choices=["stdio", "streamable-http"], 
+        choices=_VALID_TRANSPORTS, 
         help="MCP transport mode (auto-detected if not specified)"
     )
     parser.add_argument(
@@ -1548,8 +1749,16 @@ def main():
         default=None,
         help="Port for HTTP transport (default: 8001)"
     )
+    return parser
+
+def main():
+    """Entry point for direct server execution with CLI argument support."""
+    # MCP clients usually launch the server without flags; skip argparse entirely
+    if len(sys.argv) <= 1:
+        run_server()
+        return
     
-    args = parser.parse_args()
+    args = _build_parser().parse_args()
     run_server(transport=args.transport, host=args.host, port=args.port)
 
 if __name__ == "__main__":
@@ -21,6 +21,7 @@ from ..core.vibe_config import get_vibe_config, vibe_message, vibe_error
 from ..core.architectural_concept_detector import ArchitecturalConceptDetector, ConceptDetectionResult
 from .legacy.vibe_check_framework import VibeCheckFramework, VibeCheckMode, get_vibe_check_framework
 from ..utils.logging_framework import get_vibe_logger, create_migration_logger
+from .shared.github_cache import GitHubObjectCache, ISSUE_CACHE_TTL_SECONDS
 
 # Configure logging - maintain backward compatibility
 logger = logging.getLogger(__name__)
@@ -43,6 +44,7 @@ class GitHubIssueAnalyzer:
             github_token: GitHub API token for authentication (optional for public repos)
         """
         self.github_client = Github(github_token) if github_token else Github()
+        self.issue_cache = GitHubObjectCache()
         self.pattern_detector = PatternDetector()
         self.architectural_detector = ArchitecturalConceptDetector()
         self.vibe_logger = get_vibe_logger("issue_analyzer")
@@ -168,12 +170,12 @@ class GitHubIssueAnalyzer:
                     vibe_text = "Good Vibes"
                 
                 self.vibe_logger.success(f"Vibe check complete! Overall vibe: {vibe_emoji} {vibe_text}")
-                logger.info(f"Analysis completed for issue #{issue_number}: {len(detected_patterns)} patterns detected")
+                logger.info("Analysis completed for issue #%s: %d patterns detected", issue_number, len(detected_patterns))
                 return analysis_result
             
             except Exception as e:
                 self.vibe_logger.error(f"Analysis failed: {str(e)}")
-                logger.error(f"Error analyzing issue #{issue_number}: {e}")
+                logger.error("Error analyzing issue #%s: %s", issue_number, e, exc_info=True)
                 raise
     
     def _fetch_issue_data(self, issue_number: int, repository: Optional[str]) -> Dict[str, Any]:
@@ -200,9 +202,12 @@ class GitHubIssueAnalyzer:
             raise ValueError("Repository must be in format 'owner/repo'")
         
         try:
-            # Get repository and issue
-            repo = self.github_client.get_repo(repository)
-            issue: Issue = repo.get_issue(issue_number)
+            # Get repository and issue (cached, revalidated with conditional requests)
+            issue: Issue = self.issue_cache.get_or_fetch(
+                ("issue", repository, issue_number),
+                lambda: self.github_client.get_repo(repository).get_issue(issue_number),
+                ISSUE_CACHE_TTL_SECONDS
+            )
             
             # Extract relevant issue data
             issue_data = {
@@ -218,7 +223,7 @@ class GitHubIssueAnalyzer:
             }
             
             self.vibe_logger.info(f"Retrieved issue #{issue_number}: '{issue.title}'", "📄")
-            logger.info(f"Fetched issue #{issue_number} from {repository}")
+            logger.info("Fetched issue #%s from %s", issue_number, repository)
             return issue_data
             
         except GithubException as e:
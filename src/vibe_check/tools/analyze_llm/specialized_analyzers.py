@@ -8,8 +8,6 @@ pull requests, code, issues, and GitHub issue vibe checks.
 import logging
 from typing import Dict, Any, Optional, List
 
-from ..shared.claude_integration import analyze_content_async
-from ..shared.github_abstraction import get_default_github_operations
 from .llm_models import ExternalClaudeResponse
 from .text_analyzer import analyze_text_llm
 
@@ -210,6 +208,7 @@ async def analyze_github_issue_llm(
     logger.info(f"Starting external GitHub issue vibe check for {repository}#{issue_number}")
     
     # Use the GitHub abstraction layer
+    from ..shared.github_abstraction import get_default_github_operations
     github_ops = get_default_github_operations()
     
     # Check authentication first
@@ -521,6 +520,7 @@ async def analyze_github_pr_llm(
     logger.info(f"Starting external GitHub PR vibe check for {repository}#{pr_number}")
     
     # Use the GitHub abstraction layer
+    from ..shared.github_abstraction import get_default_github_operations
     github_ops = get_default_github_operations()
     
     # Check authentication first
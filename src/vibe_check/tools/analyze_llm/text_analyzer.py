@@ -11,7 +11,6 @@ import tempfile
 import time
 from typing import Optional
 
-from ..shared.claude_integration import analyze_content_async
 from .llm_models import ExternalClaudeResponse
 
 logger = logging.getLogger(__name__)
@@ -57,6 +56,7 @@ async def analyze_text_llm(
         
         try:
             # Use the shared Claude CLI executor to properly handle environment isolation
+            from ..shared.claude_integration import analyze_content_async
             result = await analyze_content_async(
                 content=full_content,
                 task_type=task_type,
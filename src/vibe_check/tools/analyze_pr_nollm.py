@@ -16,21 +16,28 @@ from datetime import datetime
 
 # GitHub integration
 try:
-    from github import Github, GithubException
+    from github import GithubException
     GITHUB_AVAILABLE = True
 except ImportError:
     GITHUB_AVAILABLE = False
 
 from ..core.pattern_detector import PatternDetector
+from .shared.github_cache import GitHubObjectCache, PR_CACHE_TTL_SECONDS
+from .shared.github_graphql import fetch_pull_request_snapshot
+from .shared.github_helpers import get_shared_github_client
 
 logger = logging.getLogger(__name__)
 
+# PRs, PR snapshots and file listings, shared across calls
+_pr_cache = GitHubObjectCache()
+
 
 def analyze_pr_nollm(
     pr_number: int,
     repository: str = "kesslerio/vibe-check-mcp",
     analysis_mode: str = "quick",
-    detail_level: str = "standard"
+    detail_level: str = "standard",
+    use_graphql: bool = True
 ) -> Dict[str, Any]:
     """
     Direct PR analysis using pattern detection and metrics (no LLM calls).
@@ -49,6 +56,8 @@ def analyze_pr_nollm(
         repository: Repository in format "owner/repo"
         analysis_mode: "quick" for basic analysis
         detail_level: "brief", "standard", or "comprehensive"
+        use_graphql: Fetch the PR and its files in one GraphQL query instead of
+            separate REST calls
         
     Returns:
         Direct analysis results without LLM reasoning
@@ -61,7 +70,7 @@ def analyze_pr_nollm(
         }
     
     try:
-        logger.info(f"🚀 Starting direct PR analysis for PR #{pr_number}")
+        logger.info("🚀 Starting direct PR analysis for PR #%s", pr_number)
         
         # Initialize GitHub client
         github_token = os.getenv("GITHUB_TOKEN")
@@ -72,36 +81,58 @@ def analyze_pr_nollm(
                 "tool_type": "analyze_pr_nollm"
             }
         
-        github_client = Github(github_token)
+        github_client = get_shared_github_client(github_token)
         
-        # Parse repository
         owner, repo_name = repository.split("/")
-        repo = github_client.get_repo(f"{owner}/{repo_name}")
-        pr = repo.get_pull(pr_number)
         
-        # Collect basic PR data
-        pr_data = {
-            "number": pr.number,
-            "title": pr.title,
-            "body": pr.body or "",
-            "state": pr.state,
-            "author": pr.user.login,
-            "created_at": pr.created_at.isoformat(),
-            "updated_at": pr.updated_at.isoformat(),
-            "mergeable": pr.mergeable,
-            "mergeable_state": pr.mergeable_state,
-            "commits": pr.commits,
-            "additions": pr.additions,
-            "deletions": pr.deletions,
-            "changed_files": pr.changed_files
-        }
+        def get_rest_pr():
+            # Lazy repo: it is only needed to address the PR, so skip the
+            # extra round-trip that fetching its metadata would cost
+            return _pr_cache.get_or_fetch(
+                ("pr", f"{owner}/{repo_name}", pr_number),
+                lambda: github_client.get_repo(f"{owner}/{repo_name}", lazy=True).get_pull(pr_number),
+                PR_CACHE_TTL_SECONDS
+            )
+        
+        if use_graphql:
+            # PR fields and first page of files in a single round-trip
+            snapshot = _pr_cache.get_or_fetch(
+                ("pr_snapshot", f"{owner}/{repo_name}", pr_number),
+                lambda: fetch_pull_request_snapshot(github_client, owner, repo_name, pr_number),
+                PR_CACHE_TTL_SECONDS
+            )
+            pr_data = dict(snapshot.pr_data)
+            if snapshot.files is not None:
+                files_analysis = _summarize_files(snapshot.files)
+            else:
+                # More files than one GraphQL page; page through REST instead
+                files_analysis = _analyze_file_changes(get_rest_pr())
+        else:
+            pr = get_rest_pr()
+            
+            # Collect basic PR data
+            pr_data = {
+                "number": pr.number,
+                "title": pr.title,
+                "body": pr.body or "",
+                "state": pr.state,
+                "author": pr.user.login,
+                "created_at": pr.created_at.isoformat(),
+                "updated_at": pr.updated_at.isoformat(),
+                "mergeable": pr.mergeable,
+                "mergeable_state": pr.mergeable_state,
+                "commits": pr.commits,
+                "additions": pr.additions,
+                "deletions": pr.deletions,
+                "changed_files": pr.changed_files
+            }
+            
+            # Analyze file changes
+            files_analysis = _analyze_file_changes(pr)
         
         # Calculate PR size classification
         size_metrics = _calculate_pr_size(pr_data)
         
-        # Analyze file changes
-        files_analysis = _analyze_file_changes(pr)
-        
         # Check issue linkage
         issue_linkage = _check_issue_linkage(pr_data["body"], pr_data["title"])
         
@@ -125,18 +156,18 @@ def analyze_pr_nollm(
             "analyzed_at": datetime.utcnow().isoformat()
         }
         
-        logger.info(f"✅ Direct PR analysis completed for PR #{pr_number}")
+        logger.info("✅ Direct PR analysis completed for PR #%s", pr_number)
         return analysis_result
         
     except GithubException as e:
-        logger.error(f"GitHub API error: {e}")
+        logger.error("GitHub API error: %s", e, exc_info=True)
         return {
             "success": False,
             "error": f"GitHub API error: {e}",
             "tool_type": "analyze_pr_nollm"
         }
     except Exception as e:
-        logger.error(f"PR analysis error: {e}")
+        logger.error("PR analysis error: %s", e, exc_info=True)
         return {
             "success": False,
             "error": f"Analysis error: {e}",
@@ -185,45 +216,56 @@ def _calculate_pr_size(pr_data: Dict[str, Any]) -> Dict[str, Any]:
 def _analyze_file_changes(pr) -> Dict[str, Any]:
     """Analyze the files changed in the PR."""
     try:
-        files = pr.get_files()
-        
-        file_types = {}
-        risk_files = []
-        large_files = []
-        
-        for file in files:
-            # Categorize by file extension
-            if '.' in file.filename:
-                ext = file.filename.split('.')[-1].lower()
-                file_types[ext] = file_types.get(ext, 0) + 1
-            
-            # Check for risky file patterns
-            if any(pattern in file.filename.lower() for pattern in [
-                'config', 'secret', 'key', 'password', 'token', 'env'
-            ]):
-                risk_files.append(file.filename)
-            
-            # Check for large file changes
-            if file.changes > 100:
-                large_files.append({
-                    "filename": file.filename,
-                    "changes": file.changes,
-                    "additions": file.additions,
-                    "deletions": file.deletions
-                })
-        
-        return {
-            "file_types": file_types,
-            "risk_files": risk_files,
-            "large_files": large_files,
-            "total_files": len(list(files))
-        }
+        # File listings are keyed by head commit, so a new push is never served stale
+        files = _pr_cache.get_or_fetch(
+            ("pr_files", pr.url, pr.head.sha),
+            lambda: list(pr.get_files()),
+            PR_CACHE_TTL_SECONDS
+        )
+        return _summarize_files(files)
         
     except Exception as e:
-        logger.warning(f"Could not analyze file changes: {e}")
+        logger.warning("Could not analyze file changes: %s", e)
         return {"error": f"File analysis failed: {e}"}
 
 
+def _summarize_files(files) -> Dict[str, Any]:
+    """Summarize changed files (REST file objects or GraphQL file records)."""
+    file_types = {}
+    risk_files = []
+    large_files = []
+    total_files = 0
+    
+    for file in files:
+        total_files += 1
+        # Categorize by file extension
+        if '.' in file.filename:
+            ext = file.filename.split('.')[-1].lower()
+            file_types[ext] = file_types.get(ext, 0) + 1
+        
+        # Check for risky file patterns
+        if any(pattern in file.filename.lower() for pattern in [
+            'config', 'secret', 'key', 'password', 'token', 'env'
+        ]):
+            risk_files.append(file.filename)
+        
+        # Check for large file changes
+        if file.changes > 100:
+            large_files.append({
+                "filename": file.filename,
+                "changes": file.changes,
+                "additions": file.additions,
+                "deletions": file.deletions
+            })
+    
+    return {
+        "file_types": file_types,
+        "risk_files": risk_files,
+        "large_files": large_files,
+        "total_files": total_files
+    }
+
+
 def _check_issue_linkage(body: str, title: str) -> Dict[str, Any]:
     """Check if PR is properly linked to issues."""
     import re
@@ -5,76 +5,475 @@ Provides text analysis for vibe check framework testing and demonstration.
 Follows action_what naming convention: analyze_text.
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any
+import multiprocessing
+import operator
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from logging.handlers import MemoryHandler, QueueHandler
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from ..core.pattern_detector import PatternDetector
-from ..core.educational_content import EducationalContentGenerator
+from ..core.pattern_detector import PatternDetector, DetectionResult
+from ..core.educational_content import EducationalContentGenerator, DetailLevel
+from .shared.semantic_cache import get_semantic_cache
 
 logger = logging.getLogger(__name__)
 
+# Pooled pattern detectors: each concurrent analysis leases its own instance, since
+# detectors lazily build per-instance caches (compiled regexes, Hyperscan database)
+_detector_pool: "queue.SimpleQueue[PatternDetector]" = queue.SimpleQueue()
+_MAX_POOLED_DETECTORS = os.cpu_count() or 4
+
+# Global educator instance (read-only after construction, safe to share)
+_educator: Optional[EducationalContentGenerator] = None
+_engine_lock = threading.Lock()
+
+# DetectionResult fields exposed in the JSON response, in output order
+_RESULT_KEYS = ("pattern_type", "detected", "confidence", "evidence", "threshold")
+_get_result_fields = operator.attrgetter(*_RESULT_KEYS)
+
+# Static parts of a successful response; per-call fields are filled into a copy
+# (placeholders keep the response key order stable)
+_ANALYSIS_METHOD = "Phase 1 validated core engine"
+_BASE_RESULT: Dict[str, Any] = {
+    "analysis_results": None,
+    "patterns": None,
+    "educational_content": None,
+    "server_status": "✅ FastMCP server operational with core engine integration",
+    "accuracy_note": "Using validated detection engine (87.5% accuracy, 0% false positives)"
+}
+
+# Case-insensitive detail level lookup keyed by lowercase name; "none" maps to
+# None and skips educational content generation entirely
+_DETAIL_LEVELS: Dict[str, Optional[DetailLevel]] = {
+    name.lower(): member for name, member in DetailLevel.__members__.items()
+}
+_DETAIL_LEVELS["none"] = None
+
+
+def _resolve_detail_level(detail_level: str) -> Optional[DetailLevel]:
+    """Map a detail level string to DetailLevel (None for "none"), defaulting to STANDARD"""
+    if detail_level in _DETAIL_LEVELS:
+        return _DETAIL_LEVELS[detail_level]
+    return _DETAIL_LEVELS.get(detail_level.lower(), DetailLevel.STANDARD)
+
+
+@contextmanager
+def lease_pattern_detector() -> Iterator[PatternDetector]:
+    """Borrow a pattern detector from the pool, creating one if none is idle"""
+    try:
+        detector = _detector_pool.get_nowait()
+    except queue.Empty:
+        detector = PatternDetector()
+    try:
+        yield detector
+    finally:
+        # Keep at most one idle detector per CPU; extras from bursts are dropped
+        if _detector_pool.qsize() < _MAX_POOLED_DETECTORS:
+            _detector_pool.put(detector)
+
+
+def get_educational_generator() -> EducationalContentGenerator:
+    """Get or create the global educational content generator (thread-safe)"""
+    global _educator
+    if _educator is None:
+        with _engine_lock:
+            # Double-check locking pattern
+            if _educator is None:
+                _educator = EducationalContentGenerator()
+    return _educator
+
+
+def reset_analysis_engines():
+    """Reset the pooled and global engine instances (for testing purposes)"""
+    global _educator
+    with _engine_lock:
+        _educator = None
+    while True:
+        try:
+            _detector_pool.get_nowait()
+        except queue.Empty:
+            break
+
+
+def _positive_int_env(name: str, default: int) -> int:
+    """Read a positive integer setting, falling back to default on malformed values"""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value <= 0:
+        logger.warning("Ignoring invalid %s=%r (expected a positive integer); using %d", name, raw, default)
+        return default
+    return value
+
+
+# Reject pathologically large inputs before running detection (characters)
+_MAX_TEXT_SIZE = _positive_int_env("VIBE_CHECK_MAX_TEXT_SIZE", 1 << 20)  # 1M chars default
+# Batches are bounded too, so many texts just under the limit cannot bypass it
+_MAX_BATCH_TEXTS = _positive_int_env("VIBE_CHECK_MAX_BATCH_TEXTS", 100)
+_MAX_BATCH_SIZE = _positive_int_env("VIBE_CHECK_MAX_BATCH_SIZE", _MAX_TEXT_SIZE)  # total characters
+
+# LRU result cache for repeated payloads (IDE auto-triggers, retries, CI replays)
+_RESULT_CACHE_MAX_ENTRIES = 512
+_RESULT_CACHE_TTL_SECONDS = 300.0
+_result_cache: "OrderedDict[Tuple[bytes, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+
+def _result_cache_key(text_bytes: bytes, detail_level: str) -> Tuple[bytes, str]:
+    """Build a compact cache key from a digest of the encoded text and the detail level"""
+    digest = hashlib.blake2b(text_bytes, digest_size=16).digest()
+    return digest, detail_level
+
+
+def clear_result_cache():
+    """Clear the analysis result cache (for testing purposes)"""
+    with _result_cache_lock:
+        _result_cache.clear()
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a cached result's mutable containers so callers cannot change the cache.
+    
+    Copies the top level, analysis_results, each pattern dict with its evidence
+    list, and the top level of educational_content. The nested educational
+    lists are shared with the cache and must be treated as read-only; deep
+    copying them cost about as much as the analysis the cache saves.
+    """
+    copied = result.copy()
+    copied["analysis_results"] = result["analysis_results"].copy()
+    copied["patterns"] = [
+        {**pattern, "evidence": list(pattern["evidence"])} for pattern in result["patterns"]
+    ]
+    copied["educational_content"] = result["educational_content"].copy()
+    return copied
+
+
+def _rebind_semantic_hit(text_length: int) -> Callable[[Dict[str, Any]], None]:
+    """Build a hook that marks a near-duplicate's cached result as describing this input"""
+    def rebind(result: Dict[str, Any]) -> None:
+        analysis_results = result.get("analysis_results")
+        if analysis_results is not None:
+            analysis_results["text_length"] = text_length
+            # Pattern evidence was extracted from the similar text, not this one
+            analysis_results["analysis_method"] = f"{analysis_results['analysis_method']} (reused from a near-duplicate text)"
+    return rebind
+
 
 def analyze_text_demo(text: str, detail_level: str = "standard") -> Dict[str, Any]:
     """
     Analyze text for anti-patterns using the validated core engine.
     
+    Successful results are cached per (text, detail_level) for a few minutes,
+    so repeated requests for the same content skip detection entirely. When
+    VIBE_CHECK_SEMANTIC_CACHE=true, near-duplicate texts are also served from
+    an embedding-based cache (see tools/shared/semantic_cache.py).
+    
+    Args:
+        text: Text content to analyze for anti-patterns
+        detail_level: Level of detail for educational content (brief/standard/comprehensive,
+            or none to skip educational content)
+        
+    Returns:
+        Dictionary containing pattern detection results and educational content.
+        Texts longer than VIBE_CHECK_MAX_TEXT_SIZE characters (default 1M) are
+        rejected with an error result without running detection.
+    """
+    return _analyze_text_cached(text, detail_level, _analyze_text)
+
+
+def _analyze_text_cached(
+    text: str,
+    detail_level: str,
+    analyze: Callable[[str, int, str, Optional[bytes]], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Run analyze() behind the size limit and this process's result and semantic caches"""
+    text_length = len(text)
+    if text_length > _MAX_TEXT_SIZE:
+        logger.warning("Text analysis rejected: %d characters exceeds limit of %d", text_length, _MAX_TEXT_SIZE)
+        return {
+            "error": f"Text too large: {text_length} characters (limit {_MAX_TEXT_SIZE})",
+            "analysis_results": {
+                "text_length": text_length,
+                "patterns_detected": 0,
+                "analysis_method": "Rejected: input exceeds size limit"
+            }
+        }
+    
+    # Encode once; the bytes feed both the cache key and the detector's scan
+    text_bytes = text.encode("utf-8", "surrogatepass")
+    key = _result_cache_key(text_bytes, detail_level)
+    now = time.monotonic()
+    
+    with _result_cache_lock:
+        entry = _result_cache.get(key)
+        if entry is not None:
+            cached_at, cached_result = entry
+            if now - cached_at <= _RESULT_CACHE_TTL_SECONDS:
+                _result_cache.move_to_end(key)
+                return _copy_result(cached_result)
+            del _result_cache[key]
+    
+    # Optional near-duplicate lookup (VIBE_CHECK_SEMANTIC_CACHE=true)
+    semantic_cache = get_semantic_cache()
+    if semantic_cache is not None:
+        result = semantic_cache.get_or_compute(
+            text, detail_level,
+            lambda: analyze(text, text_length, detail_level, text_bytes),
+            on_hit=_rebind_semantic_hit(text_length)
+        )
+    else:
+        result = analyze(text, text_length, detail_level, text_bytes)
+    
+    # Errors are not cached so transient failures can recover on retry
+    if "error" not in result:
+        with _result_cache_lock:
+            _result_cache[key] = (now, result)
+            _result_cache.move_to_end(key)
+            if len(_result_cache) > _RESULT_CACHE_MAX_ENTRIES:
+                _result_cache.popitem(last=False)
+        result = _copy_result(result)
+    
+    return result
+
+
+def analyze_texts_demo(texts: List[str], detail_level: str = "standard") -> List[Dict[str, Any]]:
+    """
+    Analyze several texts in one call.
+    
+    Each text is analyzed exactly as by analyze_text_demo (including size limit
+    and result caching), sharing the engine instances across the batch.
+    
+    Args:
+        texts: Text contents to analyze for anti-patterns
+        detail_level: Level of detail for educational content (brief/standard/comprehensive,
+            or none to skip educational content)
+        
+    Returns:
+        List of analysis results in the same order as texts. Batches of more
+        than VIBE_CHECK_MAX_BATCH_TEXTS texts (default 100) or more than
+        VIBE_CHECK_MAX_BATCH_SIZE characters in total (default: the single
+        text limit) are rejected with a single error result.
+    """
+    rejection = _batch_rejection(texts)
+    if rejection is not None:
+        return [rejection]
+    return [analyze_text_demo(text, detail_level) for text in texts]
+
+
+def _batch_rejection(texts: List[str]) -> Optional[Dict[str, Any]]:
+    """Build the error result for a batch over the count or total size limit, else None"""
+    total_length = sum(map(len, texts))
+    if len(texts) > _MAX_BATCH_TEXTS:
+        error = f"Too many texts: {len(texts)} (limit {_MAX_BATCH_TEXTS})"
+    elif total_length > _MAX_BATCH_SIZE:
+        error = f"Batch too large: {total_length} characters (limit {_MAX_BATCH_SIZE})"
+    else:
+        return None
+    logger.warning("Batch text analysis rejected: %s", error)
+    return {
+        "error": error,
+        "analysis_results": {
+            "text_length": total_length,
+            "patterns_detected": 0,
+            "analysis_method": "Rejected: batch exceeds size limit"
+        }
+    }
+
+
+# Texts above this size are analyzed in a worker process so regex scanning
+# (which holds the GIL) does not stall concurrent requests
+_PROCESS_POOL_THRESHOLD = 10_000
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+_POOL_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _init_worker_logging():
+    """
+    Process pool initializer: log straight to stderr in the worker.
+    
+    Workers exit via os._exit, so the queue- or buffer-based handlers that
+    importing the server sets up again in each worker would never be drained.
+    Workers that already log directly are left unchanged.
+    """
+    root = logging.getLogger()
+    deferred = [h for h in root.handlers if isinstance(h, (QueueHandler, MemoryHandler))]
+    if not deferred:
+        return
+    for handler in deferred:
+        root.removeHandler(handler)
+    stderr_handler = logging.StreamHandler()
+    stderr_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    root.addHandler(stderr_handler)
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """Get or create the global process pool for large text analysis (thread-safe)"""
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            # Double-check locking pattern
+            if _process_pool is None:
+                # Never fork the multithreaded server: a child could inherit a
+                # module lock (cache, engine) held by another thread forever
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context(_POOL_START_METHOD),
+                    initializer=_init_worker_logging
+                )
+    return _process_pool
+
+
+def _analyze_in_worker(
+    text: str,
+    text_length: int,
+    detail_level: str,
+    text_bytes: Optional[bytes] = None
+) -> Dict[str, Any]:
+    """Run _analyze_text in the process pool, blocking the calling thread until it finishes"""
+    # The worker re-encodes the text rather than receiving a second pickled copy
+    return get_process_pool().submit(_analyze_text, text, text_length, detail_level).result()
+
+
+async def analyze_text_demo_async(text: str, detail_level: str = "standard") -> Dict[str, Any]:
+    """
+    Async variant of analyze_text_demo that keeps the event loop responsive.
+    
+    Small texts run on the default thread pool. For texts larger than
+    _PROCESS_POOL_THRESHOLD characters, only detection runs in a worker
+    process: the size limit and the result and semantic caches are applied in
+    this process, so repeated texts hit regardless of which worker ran them.
+    
     Args:
         text: Text content to analyze for anti-patterns
-        detail_level: Level of detail for educational content (brief/standard/comprehensive)
+        detail_level: Level of detail for educational content (brief/standard/comprehensive,
+            or none to skip educational content)
+        
+    Returns:
+        Same result as analyze_text_demo
+    """
+    loop = asyncio.get_running_loop()
+    analyze = _analyze_in_worker if len(text) > _PROCESS_POOL_THRESHOLD else _analyze_text
+    return await loop.run_in_executor(None, _analyze_text_cached, text, detail_level, analyze)
+
+
+async def analyze_texts_demo_async(texts: List[str], detail_level: str = "standard") -> List[Dict[str, Any]]:
+    """
+    Async variant of analyze_texts_demo that keeps the event loop responsive.
+    
+    Batches run on the default thread pool. When the total size exceeds
+    _PROCESS_POOL_THRESHOLD characters, detection for each uncached text runs
+    in a worker process, with caching applied in this process.
+    
+    Args:
+        texts: Text contents to analyze for anti-patterns
+        detail_level: Level of detail for educational content (brief/standard/comprehensive,
+            or none to skip educational content)
         
     Returns:
-        Dictionary containing pattern detection results and educational content
+        Same result as analyze_texts_demo
     """
+    # Reject before shipping an oversized batch to a worker process
+    rejection = _batch_rejection(texts)
+    if rejection is not None:
+        return [rejection]
+    
+    loop = asyncio.get_running_loop()
+    total_length = sum(map(len, texts))
+    analyze = _analyze_in_worker if total_length > _PROCESS_POOL_THRESHOLD else _analyze_text
+    return await loop.run_in_executor(None, _analyze_texts_cached, texts, detail_level, analyze)
+
+
+def _analyze_texts_cached(
+    texts: List[str],
+    detail_level: str,
+    analyze: Callable[[str, int, str, Optional[bytes]], Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Analyze a batch with _analyze_text_cached (run as one executor job)"""
+    return [_analyze_text_cached(text, detail_level, analyze) for text in texts]
+
+
+def _no_patterns_result(text_length: int) -> Dict[str, Any]:
+    """Build the response for text with no detected patterns"""
+    result = _BASE_RESULT.copy()
+    result["analysis_results"] = {
+        "text_length": text_length,
+        "patterns_detected": 0,
+        "analysis_method": _ANALYSIS_METHOD
+    }
+    result["patterns"] = []
+    result["educational_content"] = {}
+    return result
+
+
+def _analyze_text(
+    text: str,
+    text_length: int,
+    detail_level: str,
+    text_bytes: Optional[bytes] = None
+) -> Dict[str, Any]:
+    """Run pattern detection and educational content generation without caching"""
     try:
-        # Initialize validated core components
-        detector = PatternDetector()
-        educator = EducationalContentGenerator()
+        # Analyze text using proven detection algorithms (pooled detectors are reused across calls)
+        with lease_pattern_detector() as detector:
+            patterns = detector.analyze_text_for_patterns(text, content_bytes=text_bytes)
         
-        # Analyze text using proven detection algorithms
-        patterns = detector.analyze_text_for_patterns(text)
+        # Clean text (the common case) needs no serialization or educational content
+        if not patterns:
+            return _no_patterns_result(text_length)
         
-        # Convert DetectionResult objects to dictionaries for JSON serialization
+        # Convert DetectionResult objects to dictionaries for JSON serialization,
+        # counting detections and finding the first detected pattern in the same pass
         patterns_dict = []
+        append_pattern = patterns_dict.append
+        detected_count = 0
+        first_pattern: Optional[DetectionResult] = None
         for result in patterns:
-            patterns_dict.append({
-                "pattern_type": result.pattern_type,
-                "detected": result.detected,
-                "confidence": result.confidence,
-                "evidence": result.evidence,
-                "threshold": result.threshold
-            })
+            if result.detected:
+                detected_count += 1
+                if first_pattern is None:
+                    first_pattern = result
+            append_pattern(dict(zip(_RESULT_KEYS, _get_result_fields(result))))
         
-        # Generate educational content for detected patterns
+        # Generate educational content for detected patterns (skipped for detail_level="none")
         educational_content = {}
-        if patterns and patterns[0].detected:
+        detail_enum = _resolve_detail_level(detail_level) if first_pattern is not None else None
+        if detail_enum is not None:
             # Get educational content for the first detected pattern as demo
-            first_pattern = patterns[0]
-            from ..core.educational_content import DetailLevel
-            detail_enum = getattr(DetailLevel, detail_level.upper(), DetailLevel.STANDARD)
-            educational_response = educator.generate_educational_response(
+            educational_response = get_educational_generator().generate_educational_response(
                 pattern_type=first_pattern.pattern_type,
                 confidence=first_pattern.confidence,
                 evidence=first_pattern.evidence,
                 detail_level=detail_enum
             )
             # Convert EducationalResponse dataclass to dict for JSON serialization
-            from dataclasses import asdict
-            educational_content = asdict(educational_response)
+            educational_content = educational_response.to_dict()
         
-        return {
-            "analysis_results": {
-                "text_length": len(text),
-                "patterns_detected": len([p for p in patterns if p.detected]),
-                "analysis_method": "Phase 1 validated core engine"
-            },
-            "patterns": patterns_dict,
-            "educational_content": educational_content,
-            "server_status": "✅ FastMCP server operational with core engine integration",
-            "accuracy_note": "Using validated detection engine (87.5% accuracy, 0% false positives)"
+        result = _BASE_RESULT.copy()
+        result["analysis_results"] = {
+            "text_length": text_length,
+            "patterns_detected": detected_count,
+            "analysis_method": _ANALYSIS_METHOD
         }
+        result["patterns"] = patterns_dict
+        result["educational_content"] = educational_content
+        return result
         
     except Exception as e:
-        logger.error(f"Text analysis failed: {e}")
+        logger.error("Text analysis failed: %s", e, exc_info=True)
         return {
             "error": f"Analysis failed: {str(e)}",
             "analysis_results": {
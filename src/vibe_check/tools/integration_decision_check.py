@@ -13,12 +13,25 @@ Features:
 - Red flag detection for anti-patterns
 """
 
+import copy
+import functools
 import json
 import logging
+import re
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
+from ..utils.dataclass_utils import DATACLASS_SLOTS
+from ..utils.json_serialization import loads
+
+# Optional Hyperscan multi-literal matching for long texts
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
 # Web search capabilities available via MCP tools
 WEB_SEARCH_AVAILABLE = True  # We can always try MCP tools
 
@@ -43,8 +56,24 @@ SCORING = {
     }
 }
 
+# Terms suggesting custom development work in free text (substring matches)
+CUSTOM_WORK_INDICATORS = (
+    "custom", "build", "implement", "create", "develop", "write",
+    "fastapi", "flask", "express", "server", "api", "rest",
+    "authentication", "auth", "jwt", "storage", "database"
+)
+
+# Memoized check_official_alternatives results
+OFFICIAL_ALTERNATIVES_CACHE_SIZE = 256
+
+# Texts at least this long are scanned for all terms in a single Hyperscan pass
+MULTI_TERM_SCAN_MIN_LENGTH = 4096
+
 logger = logging.getLogger(__name__)
 
+# Compiled Hyperscan databases keyed by term tuple (None if compilation failed)
+_term_databases: Dict[Tuple[str, ...], Any] = {}
+
 class ValidationError(Exception):
     """Raised when input validation fails."""
     pass
@@ -116,27 +145,46 @@ def build_recommendation_result(
     return IntegrationRecommendation(
         technology=technology,
         warning_level=warning_level,
-        official_solutions=official_solutions,
+        official_solutions=tuple(official_solutions),
         custom_justification_needed=custom_justification_needed,
         research_required=research_required,
-        red_flags_detected=red_flags_detected,
+        red_flags_detected=tuple(red_flags_detected),
         decision_matrix=decision_matrix,
-        next_steps=next_steps,
+        next_steps=tuple(next_steps),
         recommendation=recommendation
     )
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class IntegrationRecommendation:
-    """Structured recommendation for integration decisions."""
+    """
+    Structured recommendation for integration decisions.
+    
+    Instances are memoized and shared, so sequence fields are tuples and
+    decision_matrix must be treated as read-only; to_dict returns copies.
+    """
     technology: str
     warning_level: str  # "none", "caution", "warning", "critical"
-    official_solutions: List[str]
+    official_solutions: Tuple[str, ...]
     custom_justification_needed: bool
     research_required: bool
-    red_flags_detected: List[str]
+    red_flags_detected: Tuple[str, ...]
     decision_matrix: Dict[str, Any]
-    next_steps: List[str]
+    next_steps: Tuple[str, ...]
     recommendation: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the fields as a dict in declaration order, with lists and a copied decision matrix"""
+        return {
+            "technology": self.technology,
+            "warning_level": self.warning_level,
+            "official_solutions": list(self.official_solutions),
+            "custom_justification_needed": self.custom_justification_needed,
+            "research_required": self.research_required,
+            "red_flags_detected": list(self.red_flags_detected),
+            "decision_matrix": copy.deepcopy(self.decision_matrix),
+            "next_steps": list(self.next_steps),
+            "recommendation": self.recommendation
+        }
 
 class IntegrationKnowledgeBase:
     """Knowledge base for integration technologies and their official solutions."""
@@ -161,7 +209,7 @@ class IntegrationKnowledgeBase:
             
             if kb_path.exists():
                 with open(kb_path, 'r') as f:
-                    return json.load(f)
+                    return loads(f.read())
             else:
                 logger.warning(f"Knowledge base not found at {kb_path}")
                 return {}
@@ -376,6 +424,9 @@ def check_official_alternatives(
     """
     Check if technology provides official solutions for custom features.
     
+    Results are memoized per exact (technology, custom_features) pair, since
+    both are echoed back in the recommendation text.
+    
     Args:
         technology: Name of the technology (e.g., "cognee", "supabase")
         custom_features: List of features being custom developed
@@ -389,20 +440,75 @@ def check_official_alternatives(
     # Validate inputs
     validate_inputs(technology, custom_features)
     
+    return _check_official_alternatives_cached(technology, tuple(custom_features))
+
+@functools.lru_cache(maxsize=OFFICIAL_ALTERNATIVES_CACHE_SIZE)
+def _check_official_alternatives_cached(
+    technology: str,
+    custom_features: Tuple[str, ...]
+) -> IntegrationRecommendation:
+    """Build the recommendation for validated inputs; shared between identical calls"""
+    features_list = list(custom_features)
+    
     # Get technology information
     kb = IntegrationKnowledgeBase()
     technology_info = kb.get_technology_info(technology)
     
     # Analyze features and detect red flags
     red_flags_detected, feature_coverage, warning_level = analyze_features_and_flags(
-        custom_features, technology_info
+        features_list, technology_info
     )
     
     # Build and return recommendation
     return build_recommendation_result(
-        technology, technology_info, red_flags_detected, warning_level, custom_features
+        technology, technology_info, red_flags_detected, warning_level, features_list
     )
 
+def reset_official_alternatives_cache():
+    """Clear memoized recommendations (for testing purposes or after knowledge base changes)"""
+    _check_official_alternatives_cached.cache_clear()
+
+def _scan_terms(text_lower: str, terms: Tuple[str, ...]) -> Optional[Set[int]]:
+    """Scan text once for all literal terms; returns matched term indexes or None if unavailable"""
+    if terms not in _term_databases:
+        try:
+            database = hyperscan.Database()
+            database.compile(
+                expressions=[re.escape(term).encode("utf-8") for term in terms],
+                ids=list(range(len(terms))),
+                elements=len(terms),
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH] * len(terms)
+            )
+        except Exception as e:
+            logger.warning("Hyperscan term compilation failed, using substring search: %s", e)
+            database = None
+        _term_databases[terms] = database
+    
+    database = _term_databases[terms]
+    if database is None:
+        return None
+    
+    matched: Set[int] = set()
+    
+    def on_match(term_id, start, end, flags, context):
+        matched.add(term_id)
+    
+    # UTF-8 is self-synchronizing, so byte substring matches equal str substring matches
+    try:
+        database.scan(text_lower.encode("utf-8", "surrogatepass"), match_event_handler=on_match)
+    except hyperscan.error as e:
+        logger.warning("Hyperscan term scan failed, using substring search: %s", e)
+        return None
+    return matched
+
+def _find_terms(text_lower: str, terms: Tuple[str, ...]) -> List[str]:
+    """Return the terms occurring as substrings of text_lower, in terms order."""
+    if HYPERSCAN_AVAILABLE and terms and len(text_lower) >= MULTI_TERM_SCAN_MIN_LENGTH:
+        matched = _scan_terms(text_lower, terms)
+        if matched is not None:
+            return [term for index, term in enumerate(terms) if index in matched]
+    return [term for term in terms if term in text_lower]
+
 def analyze_integration_text(text: str) -> Dict[str, Any]:
     """
     Analyze text for integration patterns and provide recommendations.
@@ -417,21 +523,10 @@ def analyze_integration_text(text: str) -> Dict[str, Any]:
     
     # Detect technologies mentioned
     kb = IntegrationKnowledgeBase()
-    detected_technologies = []
-    
-    for tech in kb.knowledge.keys():
-        if tech in text_lower:
-            detected_technologies.append(tech)
+    detected_technologies = _find_terms(text_lower, tuple(kb.knowledge.keys()))
     
     # Detect potential custom development indicators
-    custom_indicators = [
-        "custom", "build", "implement", "create", "develop", "write",
-        "fastapi", "flask", "express", "server", "api", "rest",
-        "authentication", "auth", "jwt", "storage", "database"
-    ]
-    
-    detected_custom_work = [indicator for indicator in custom_indicators 
-                           if indicator in text_lower]
+    detected_custom_work = _find_terms(text_lower, CUSTOM_WORK_INDICATORS)
     
     results = {
         "detected_technologies": detected_technologies,
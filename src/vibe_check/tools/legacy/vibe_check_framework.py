@@ -26,6 +26,7 @@ from github.Issue import Issue
 from ...core.pattern_detector import PatternDetector, DetectionResult
 from ...core.educational_content import DetailLevel
 from ...core.vibe_coaching import get_vibe_coaching_framework, LearningLevel, CoachingTone
+from ..shared.github_cache import GitHubObjectCache, ISSUE_CACHE_TTL_SECONDS
 
 # Import Claude CLI debug/verbose config
 from ...utils import CLAUDE_CLI_DEBUG, CLAUDE_CLI_VERBOSE
@@ -78,6 +79,7 @@ class VibeCheckFramework:
     def __init__(self, github_token: Optional[str] = None):
         """Initialize the vibe check framework"""
         self.github_client = Github(github_token) if github_token else Github()
+        self.issue_cache = GitHubObjectCache()
         self.pattern_detector = PatternDetector()
         self.claude_available = self._check_claude_availability()
         logger.info("Vibe Check Framework initialized")
@@ -145,6 +147,14 @@ class VibeCheckFramework:
                 technical_analysis={"error": str(e)}
             )
     
+    def _get_issue(self, issue_number: int, repository: str) -> Issue:
+        """Get a GitHub issue, served from the TTL/ETag cache when possible"""
+        return self.issue_cache.get_or_fetch(
+            ("issue", repository, issue_number),
+            lambda: self.github_client.get_repo(repository).get_issue(issue_number),
+            ISSUE_CACHE_TTL_SECONDS
+        )
+    
     def _fetch_issue_data(self, issue_number: int, repository: Optional[str]) -> Dict[str, Any]:
         """Fetch GitHub issue data (same as original implementation)"""
         if repository is None:
@@ -154,8 +164,7 @@ class VibeCheckFramework:
             raise ValueError("Repository must be in format 'owner/repo'")
         
         try:
-            repo = self.github_client.get_repo(repository)
-            issue: Issue = repo.get_issue(issue_number)
+            issue: Issue = self._get_issue(issue_number, repository)
             
             return {
                 "number": issue.number,
@@ -908,8 +917,7 @@ Remember: Use encouraging, friendly language that helps developers learn rather
     def _post_github_comment(self, issue_number: int, repository: str, vibe_result: VibeCheckResult) -> None:
         """Post vibe check result as GitHub comment"""
         try:
-            repo = self.github_client.get_repo(repository)
-            issue = repo.get_issue(issue_number)
+            issue = self._get_issue(issue_number, repository)
             
             # Format comment
             comment_body = self._format_github_comment(vibe_result)
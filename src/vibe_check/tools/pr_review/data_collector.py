@@ -5,12 +5,13 @@ Handles GitHub API interactions and PR data collection.
 This module extracts data collection functionality from the monolithic PRReviewTool.
 """
 
-import json
 import logging
 import re
 import subprocess
 from typing import Dict, Any, List
 
+from ...utils.json_serialization import loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,7 +49,7 @@ class PRDataCollector:
                 "--json", "title,body,files,additions,deletions,author,createdAt,baseRefName,headRefName,comments"
             ], capture_output=True, text=True, check=True)
             
-            pr_info = json.loads(pr_result.stdout)
+            pr_info = loads(pr_result.stdout)
             
             # Get PR diff
             diff_result = subprocess.run([
@@ -122,7 +123,7 @@ class PRDataCollector:
                         "--json", "title,body,labels,state"
                     ], capture_output=True, text=True, check=True)
                     
-                    issue_data = json.loads(issue_result.stdout)
+                    issue_data = loads(issue_result.stdout)
                     linked_issues.append({
                         "number": int(issue_num),
                         "action": action,
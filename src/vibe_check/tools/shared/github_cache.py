@@ -0,0 +1,99 @@
+"""
+GitHub Object Cache
+
+TTL cache for PyGithub objects fetched by the GitHub analysis tools, so
+iterative "vibe check issue 23" flows do not re-hit the GitHub API on every
+call.
+
+Fresh entries are served with no request at all. Expired entries holding a
+PyGithub object are revalidated with a conditional request (If-None-Match /
+If-Modified-Since via the object's update()); a 304 response does not count
+against the GitHub rate limit and keeps the cached object. Other values are
+simply refetched once expired.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple, TypeVar
+
+try:
+    from github import GithubException
+    from github.GithubObject import CompletableGithubObject
+    GITHUB_AVAILABLE = True
+except ImportError:
+    GITHUB_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Issues change rarely during an analysis session; PRs (and their file lists) move faster
+ISSUE_CACHE_TTL_SECONDS = 300.0
+PR_CACHE_TTL_SECONDS = 60.0
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class GitHubObjectCache:
+    """
+    Bounded LRU cache of GitHub API results with per-entry TTL.
+
+    Fetching and revalidation run outside the lock, so a slow GitHub call
+    never blocks lookups for other keys.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """Initialize an empty cache holding at most max_entries results"""
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], T], ttl: float) -> T:
+        """
+        Return the cached value for key, revalidating or fetching it as needed.
+
+        Args:
+            key: Cache key, e.g. ("issue", "owner/repo", 23)
+            fetch: Callable performing the GitHub request on a cache miss
+            ttl: Seconds before the entry must be revalidated
+
+        Returns:
+            Cached or freshly fetched value; exceptions from fetch propagate
+            and nothing is cached
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None:
+            expires_at, value = entry
+            if now < expires_at:
+                return value
+            if GITHUB_AVAILABLE and isinstance(value, CompletableGithubObject):
+                try:
+                    changed = value.update()
+                    logger.debug("GitHub cache revalidated %s (changed: %s)", key, changed)
+                    self._store(key, value, now + ttl)
+                    return value
+                except GithubException as e:
+                    logger.debug("GitHub cache revalidation failed for %s: %s", key, e)
+
+        value = fetch()
+        self._store(key, value, now + ttl)
+        return value
+
+    def _store(self, key: Hashable, value: Any, expires_at: float):
+        """Insert or refresh an entry, evicting the least recently used one if full"""
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,123 @@
+"""
+GitHub GraphQL Pull Request Snapshot
+
+Fetches the pull request fields used by the fast PR analysis, together with
+its first page of changed files, in a single GraphQL round-trip instead of
+separate REST calls for the PR and its file listing.
+
+Results are reshaped to match what the REST path produces (lowercase state
+strings, ISO timestamps with UTC offset, file records exposing filename,
+additions, deletions and changes).
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from ...utils.dataclass_utils import DATACLASS_SLOTS
+
+# GraphQL connections are capped at 100 nodes per page
+PR_FILES_PAGE_SIZE = 100
+
+PR_SNAPSHOT_QUERY = """
+query($owner: String!, $name: String!, $number: Int!, $filesPage: Int!) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      number
+      title
+      body
+      state
+      author { login }
+      createdAt
+      updatedAt
+      mergeable
+      mergeStateStatus
+      commits { totalCount }
+      additions
+      deletions
+      changedFiles
+      files(first: $filesPage) {
+        pageInfo { hasNextPage }
+        nodes { path additions deletions }
+      }
+    }
+  }
+}
+"""
+
+# GraphQL enum values mapped to their REST equivalents
+_REST_STATE = {"OPEN": "open", "CLOSED": "closed", "MERGED": "closed"}
+_REST_MERGEABLE = {"MERGEABLE": True, "CONFLICTING": False, "UNKNOWN": None}
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class PullRequestFile:
+    """Changed file record with the attributes the REST file objects expose"""
+    filename: str
+    additions: int
+    deletions: int
+    changes: int
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class PullRequestSnapshot:
+    """Pull request data plus its changed files (None if more than one page)"""
+    pr_data: Dict[str, Any]
+    files: Optional[List[PullRequestFile]]
+
+
+def _rest_timestamp(value: str) -> str:
+    """Convert a GraphQL timestamp ("...Z") to REST-style isoformat output"""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).isoformat()
+
+
+def fetch_pull_request_snapshot(github_client, owner: str, name: str, number: int) -> PullRequestSnapshot:
+    """
+    Fetch a pull request and its changed files with one GraphQL query.
+
+    Args:
+        github_client: Authenticated PyGithub client
+        owner: Repository owner
+        name: Repository name
+        number: Pull request number
+
+    Returns:
+        PullRequestSnapshot; GithubException propagates for API errors
+        (including UnknownObjectException for a missing PR)
+    """
+    _, data = github_client.requester.graphql_query(
+        PR_SNAPSHOT_QUERY,
+        {"owner": owner, "name": name, "number": number, "filesPage": PR_FILES_PAGE_SIZE}
+    )
+    pr = data["data"]["repository"]["pullRequest"]
+
+    pr_data = {
+        "number": pr["number"],
+        "title": pr["title"],
+        "body": pr["body"] or "",
+        "state": _REST_STATE.get(pr["state"], pr["state"].lower()),
+        "author": pr["author"]["login"] if pr["author"] else "ghost",
+        "created_at": _rest_timestamp(pr["createdAt"]),
+        "updated_at": _rest_timestamp(pr["updatedAt"]),
+        "mergeable": _REST_MERGEABLE.get(pr["mergeable"]),
+        "mergeable_state": (pr["mergeStateStatus"] or "unknown").lower(),
+        "commits": pr["commits"]["totalCount"],
+        "additions": pr["additions"],
+        "deletions": pr["deletions"],
+        "changed_files": pr["changedFiles"]
+    }
+
+    files_page = pr["files"]
+    files = None
+    if not files_page["pageInfo"]["hasNextPage"]:
+        files = [
+            PullRequestFile(
+                filename=node["path"],
+                additions=node["additions"],
+                deletions=node["deletions"],
+                changes=node["additions"] + node["deletions"]
+            )
+            for node in files_page["nodes"]
+        ]
+
+    return PullRequestSnapshot(pr_data=pr_data, files=files)
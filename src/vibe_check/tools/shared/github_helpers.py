@@ -5,10 +5,12 @@ Consolidated GitHub integration utilities shared across vibe check tools.
 Provides authentication, API access, and comment posting functionality.
 """
 
+import atexit
 import logging
 import os
 import subprocess
-from typing import Optional, Any
+import threading
+from typing import Dict, Optional, Any
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,47 @@ except ImportError:
     GITHUB_AVAILABLE = False
 
 
+# Github clients shared per token: each keeps its HTTPS connection alive, so
+# repeated tool calls skip the TCP/TLS handshake a fresh client would pay
+_shared_clients: Dict[str, "Github"] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_github_client(token: str) -> "Github":
+    """
+    Get the process-wide GitHub client for a token, creating it on first use.
+    
+    Args:
+        token: GitHub token to authenticate with
+        
+    Returns:
+        Github client reused by every caller with the same token
+    """
+    client = _shared_clients.get(token)
+    if client is None:
+        with _shared_clients_lock:
+            client = _shared_clients.get(token)
+            if client is None:
+                client = Github(token)
+                _shared_clients[token] = client
+    return client
+
+
+def reset_shared_github_clients():
+    """Close and drop all shared GitHub clients (for testing purposes and shutdown)"""
+    with _shared_clients_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception as e:
+            logger.debug("Failed to close GitHub client: %s", e)
+
+
+atexit.register(reset_shared_github_clients)
+
+
 def get_github_token() -> Optional[str]:
     """
     Get GitHub token from environment or gh CLI.
@@ -70,7 +113,7 @@ def post_github_comment(issue_number: int, repository: str, comment_body: str) -
         return False, None
     
     try:
-        github_client = Github(token)
+        github_client = get_shared_github_client(token)
         repo = github_client.get_repo(repository)
         issue = repo.get_issue(issue_number)
         comment = issue.create_comment(comment_body)
@@ -102,7 +145,7 @@ def get_github_client() -> Optional[Github]:
         return None
         
     try:
-        return Github(token)
+        return get_shared_github_client(token)
     except Exception as e:
         logger.error(f"Failed to create GitHub client: {e}")
         return None
@@ -131,7 +174,7 @@ def check_github_authentication() -> dict:
         }
     
     try:
-        client = Github(token)
+        client = get_shared_github_client(token)
         user = client.get_user()
         return {
             "authenticated": True,
@@ -0,0 +1,164 @@
+"""
+Semantic Result Cache
+
+Optional second-level cache for text analysis results. Near-duplicate texts
+(lightly edited or paraphrased payloads) are matched by embedding similarity
+so the analysis can be reused instead of recomputed.
+
+The cache is disabled by default and requires optional dependencies:
+    pip install faiss-cpu sentence-transformers
+
+Enable with VIBE_CHECK_SEMANTIC_CACHE=true.
+"""
+
+import copy
+import logging
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEMANTIC_CACHE_ENABLED = os.getenv("VIBE_CHECK_SEMANTIC_CACHE") == "true"
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+DEFAULT_SIMILARITY_THRESHOLD = 0.95
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class SemanticResultCache:
+    """
+    Embedding-based cache mapping near-duplicate texts to a stored result.
+
+    Entries are partitioned by detail level so a brief result is never served
+    for a comprehensive request. When a partition reaches max_entries it is
+    cleared and starts filling again (flat FAISS indexes do not support
+    cheap eviction).
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """Initialize the cache; raises ImportError if optional dependencies are missing"""
+        import faiss
+        from sentence_transformers import SentenceTransformer
+
+        self._faiss = faiss
+        self._model = SentenceTransformer(model_name)
+        self._dimension = self._model.get_sentence_embedding_dimension()
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self._partitions: Dict[str, Tuple[Any, List[Dict[str, Any]]]] = {}
+        self._lock = threading.Lock()
+
+    def _embed(self, text: str):
+        """Embed text as a normalized float32 row vector"""
+        vector = self._model.encode([text], convert_to_numpy=True).astype("float32")
+        self._faiss.normalize_L2(vector)
+        return vector
+
+    def get_or_compute(
+        self,
+        text: str,
+        detail_level: str,
+        compute: Callable[[], Dict[str, Any]],
+        on_hit: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return a cached result for a near-duplicate text, or compute and store one.
+
+        Cached results are deep-copied on the way in and out, so callers never
+        share (or mutate) a stored entry.
+
+        Args:
+            text: Text being analyzed
+            detail_level: Detail level of the request (cache partition)
+            compute: Callable producing the result on a cache miss
+            on_hit: Called with the copy of a cached result to overwrite fields
+                that describe the neighbouring text rather than this one
+
+        Returns:
+            Cached or freshly computed result; results with an "error" key are not stored
+        """
+        try:
+            vector = self._embed(text)
+        except Exception as e:
+            # The cache is an optimization; it must never fail the analysis
+            logger.warning("Semantic cache skipped: embedding failed (%s)", e)
+            return compute()
+
+        cached = None
+        with self._lock:
+            partition = self._partitions.get(detail_level)
+            if partition is not None and partition[0].ntotal:
+                index, values = partition
+                scores, ids = index.search(vector, 1)
+                if scores[0][0] >= self.similarity_threshold:
+                    logger.debug("Semantic cache hit (similarity %.3f)", scores[0][0])
+                    cached = values[ids[0][0]]
+
+        if cached is not None:
+            # Entries are never mutated in place, so copying outside the lock is safe
+            result = copy.deepcopy(cached)
+            if on_hit is not None:
+                on_hit(result)
+            return result
+
+        result = compute()
+        if "error" in result:
+            return result
+
+        with self._lock:
+            partition = self._partitions.get(detail_level)
+            if partition is None or partition[0].ntotal >= self.max_entries:
+                partition = (self._faiss.IndexFlatIP(self._dimension), [])
+                self._partitions[detail_level] = partition
+            index, values = partition
+            index.add(vector)
+            values.append(copy.deepcopy(result))
+
+        return result
+
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._partitions.clear()
+
+
+_semantic_cache: Optional[SemanticResultCache] = None
+_semantic_cache_unavailable = False
+_semantic_cache_lock = threading.Lock()
+
+
+def get_semantic_cache() -> Optional[SemanticResultCache]:
+    """
+    Get the global semantic cache, or None when disabled or unavailable.
+
+    The embedding model is loaded lazily on first use. Missing optional
+    dependencies or a failed model load are logged once and the cache stays
+    disabled.
+    """
+    global _semantic_cache, _semantic_cache_unavailable
+    if not SEMANTIC_CACHE_ENABLED or _semantic_cache_unavailable:
+        return None
+    if _semantic_cache is None:
+        with _semantic_cache_lock:
+            # Double-check locking pattern
+            if _semantic_cache is None and not _semantic_cache_unavailable:
+                try:
+                    _semantic_cache = SemanticResultCache()
+                except ImportError as e:
+                    _semantic_cache_unavailable = True
+                    logger.warning(
+                        "Semantic cache requested but dependencies are missing (%s). "
+                        "Install faiss-cpu and sentence-transformers to enable it.", e
+                    )
+                except Exception as e:
+                    # Model download or load failures (OSError, hub/network errors)
+                    # are not retried on every request
+                    _semantic_cache_unavailable = True
+                    logger.warning("Semantic cache disabled: embedding model failed to load (%s)", e)
+    return _semantic_cache
@@ -0,0 +1,10 @@
+"""
+Dataclass helpers for Vibe Check MCP.
+
+Shared keyword arguments for @dataclass declarations across modules.
+"""
+
+import sys
+
+# Slotted dataclasses (Python 3.10+) avoid a per-instance __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
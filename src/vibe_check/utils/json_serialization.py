@@ -0,0 +1,61 @@
+"""
+JSON serialization helpers for Vibe Check MCP.
+
+Uses orjson when installed for faster tool result serialization and JSON
+parsing. Tool results otherwise go through pydantic_core (FastMCP's own
+serializer) and JSON parsing through the standard library.
+"""
+
+import json
+from typing import Any
+
+import pydantic_core
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _to_jsonable(obj: Any) -> Any:
+    """Convert values orjson cannot encode the way FastMCP's pydantic serializer does"""
+    return pydantic_core.to_jsonable_python(obj, fallback=str)
+
+
+def serialize_tool_result(data: Any) -> str:
+    """
+    Serialize an MCP tool result to indented JSON text.
+
+    Produces FastMCP's default output (2-space indent, pydantic conversion
+    of enums, dataclasses, sets and bytes, str() for anything else). orjson
+    encodes the common types natively and defers the rest to pydantic_core.
+
+    Args:
+        data: Tool return value
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data,
+            default=_to_jsonable,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return pydantic_core.to_json(data, fallback=str, indent=2).decode()
+
+
+def loads(data: Any) -> Any:
+    """
+    Parse JSON from str or bytes.
+
+    Args:
+        data: JSON document as str, bytes or bytearray
+
+    Returns:
+        Parsed Python object
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
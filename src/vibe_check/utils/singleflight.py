@@ -0,0 +1,51 @@
+"""
+Single-flight deduplication for async MCP tool handlers.
+
+Concurrent calls to a decorated coroutine function with identical arguments
+share one in-flight execution: the first call starts it, later callers await
+the same result instead of repeating GitHub fetches and pattern detection.
+Nothing is cached once the call completes.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+# In-flight executions keyed by function name and argument digest
+_inflight: Dict[str, "asyncio.Future[Any]"] = {}
+
+
+def _call_key(name: str, signature: inspect.Signature, args: tuple, kwargs: dict) -> str:
+    """Build a key from the function name and a SHA-256 of its canonical arguments"""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    payload = json.dumps(bound.arguments, sort_keys=True, default=str)
+    return f"{name}:{hashlib.sha256(payload.encode('utf-8', 'surrogatepass')).hexdigest()}"
+
+
+def singleflight(fn: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """
+    Deduplicate concurrent identical calls to an async function.
+
+    The shared execution runs as its own task, so a caller being cancelled
+    does not cancel the work other callers are waiting on.
+    """
+    signature = inspect.signature(fn)
+    name = f"{fn.__module__}.{fn.__qualname__}"
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        key = _call_key(name, signature, args, kwargs)
+        future = _inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fn(*args, **kwargs))
+            _inflight[key] = future
+            future.add_done_callback(lambda _: _inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+    return wrapper
@@ -24,6 +24,13 @@ from vibe_check.server import detect_transport_mode, run_server
 class TestTransportModeDetection:
     """Test automatic transport mode detection logic."""
     
+    @pytest.fixture(autouse=True)
+    def clear_transport_cache(self):
+        """Detection is memoized per process; re-read the environment for each case."""
+        detect_transport_mode.cache_clear()
+        yield
+        detect_transport_mode.cache_clear()
+    
     def test_docker_detection(self, monkeypatch):
         """Test Docker environment detection."""
         # Mock Docker environment
@@ -32,6 +39,7 @@ class TestTransportModeDetection:
         
         # Test with .dockerenv file
         monkeypatch.delenv("RUNNING_IN_DOCKER", raising=False)
+        detect_transport_mode.cache_clear()
         with tempfile.NamedTemporaryFile() as tmp:
             monkeypatch.setattr("os.path.exists", lambda path: path == "/.dockerenv")
             assert detect_transport_mode() == "streamable-http"
@@ -43,6 +51,7 @@ class TestTransportModeDetection:
         
         monkeypatch.delenv("MCP_CLAUDE_DESKTOP", raising=False)
         monkeypatch.setenv("CLAUDE_CODE_MODE", "true") 
+        detect_transport_mode.cache_clear()
         assert detect_transport_mode() == "stdio"
     
     def test_explicit_override(self, monkeypatch):
@@ -51,8 +60,17 @@ class TestTransportModeDetection:
         assert detect_transport_mode() == "stdio"
         
         monkeypatch.setenv("MCP_TRANSPORT", "streamable-http")
+        detect_transport_mode.cache_clear()
         assert detect_transport_mode() == "streamable-http"
     
+    def test_detection_memoized(self, monkeypatch):
+        """Test that the environment is only read on the first call."""
+        monkeypatch.setenv("MCP_TRANSPORT", "stdio")
+        assert detect_transport_mode() == "stdio"
+        
+        monkeypatch.setenv("MCP_TRANSPORT", "streamable-http")
+        assert detect_transport_mode() == "stdio"
+    
     def test_terminal_detection(self, monkeypatch):
         """Test terminal-based detection."""
         # Clear all environment variables that could affect detection
@@ -67,6 +85,7 @@ class TestTransportModeDetection:
         
         # Mock server environment (no TERM)
         monkeypatch.delenv("TERM", raising=False)
+        detect_transport_mode.cache_clear()
         assert detect_transport_mode() == "streamable-http"
 
 
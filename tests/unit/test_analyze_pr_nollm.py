@@ -0,0 +1,204 @@
+"""
+Unit Tests for Fast PR Analysis Tool
+
+Tests the analyze_pr_nollm GitHub access paths:
+- Repository is fetched lazily (no extra round-trip)
+- Changed files are listed in a single pass
+- PRs and file listings are served from the GitHub cache
+- GitHub clients are shared across calls with the same token
+- GraphQL snapshots replace the separate PR and file listing requests
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import patch, MagicMock
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from vibe_check.tools import analyze_pr_nollm as analyze_pr_module
+from vibe_check.tools.shared import github_helpers
+from vibe_check.tools.analyze_pr_nollm import analyze_pr_nollm, _analyze_file_changes
+
+
+@pytest.fixture(autouse=True)
+def clear_pr_cache():
+    """Ensure each test starts with an empty PR cache and no shared clients"""
+    analyze_pr_module._pr_cache.clear()
+    github_helpers.reset_shared_github_clients()
+    yield
+    analyze_pr_module._pr_cache.clear()
+    github_helpers.reset_shared_github_clients()
+
+
+def _graphql_response(files, has_next_page=False, state="OPEN"):
+    return {}, {"data": {"repository": {"pullRequest": {
+        "number": 42,
+        "title": "Fix bug",
+        "body": None,
+        "state": state,
+        "author": {"login": "octocat"},
+        "createdAt": "2024-05-01T12:00:00Z",
+        "updatedAt": "2024-05-02T08:30:00Z",
+        "mergeable": "CONFLICTING",
+        "mergeStateStatus": "DIRTY",
+        "commits": {"totalCount": 3},
+        "additions": 160,
+        "deletions": 20,
+        "changedFiles": len(files),
+        "files": {
+            "pageInfo": {"hasNextPage": has_next_page},
+            "nodes": [{"path": path, "additions": adds, "deletions": dels} for path, adds, dels in files]
+        }
+    }}}}
+
+
+def _make_file(filename, changes=10):
+    file = MagicMock()
+    file.filename = filename
+    file.changes = changes
+    file.additions = changes
+    file.deletions = 0
+    return file
+
+
+class CountingFiles:
+    """Iterable standing in for a PyGithub PaginatedList that counts listings"""
+
+    def __init__(self, files):
+        self.files = files
+        self.iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return iter(self.files)
+
+
+class TestFileChanges:
+    """Test changed file analysis"""
+
+    def test_files_listed_once(self):
+        """Test that the paginated file listing is only iterated once"""
+        files = CountingFiles([
+            _make_file("src/app.py"),
+            _make_file("config/settings.yaml"),
+            _make_file("src/big.py", changes=500),
+        ])
+        pr = MagicMock()
+        pr.get_files.return_value = files
+
+        result = _analyze_file_changes(pr)
+
+        assert files.iterations == 1
+        assert result["total_files"] == 3
+        assert result["file_types"] == {"py": 2, "yaml": 1}
+        assert result["risk_files"] == ["config/settings.yaml"]
+        assert [f["filename"] for f in result["large_files"]] == ["src/big.py"]
+
+
+class TestRepositoryAccess:
+    """Test GitHub repository access"""
+
+    @patch.dict(os.environ, {"GITHUB_TOKEN": "test-token"})
+    def test_repository_fetched_lazily(self):
+        """Test that the repository is addressed without fetching its metadata"""
+        with patch.object(github_helpers, 'Github') as mock_github_class:
+            mock_client = mock_github_class.return_value
+            pr = mock_client.get_repo.return_value.get_pull.return_value
+            pr.body = "Fixes #1"
+            pr.title = "Fix bug"
+            pr.additions, pr.deletions, pr.changed_files, pr.commits = 10, 2, 1, 1
+            pr.get_files.return_value = []
+
+            result = analyze_pr_nollm(42, "owner/repo", use_graphql=False)
+
+        mock_client.get_repo.assert_called_once_with("owner/repo", lazy=True)
+        mock_client.get_repo.return_value.get_pull.assert_called_once_with(42)
+        assert result["success"] is True
+
+    @patch.dict(os.environ, {"GITHUB_TOKEN": "test-token"})
+    def test_client_shared_across_calls(self):
+        """Test that one GitHub client (and its connection) serves repeated calls"""
+        with patch.object(github_helpers, 'Github') as mock_github_class:
+            pr = mock_github_class.return_value.get_repo.return_value.get_pull.return_value
+            pr.body = ""
+            pr.title = "Fix bug"
+            pr.additions, pr.deletions, pr.changed_files, pr.commits = 10, 2, 1, 1
+            pr.get_files.return_value = []
+
+            analyze_pr_nollm(42, "owner/repo", use_graphql=False)
+            analyze_pr_nollm(43, "owner/repo", use_graphql=False)
+
+        mock_github_class.assert_called_once_with("test-token")
+
+    def test_files_cached_per_head_commit(self):
+        """Test that file listings are reused until the PR head changes"""
+        pr = MagicMock()
+        pr.url = "https://api.github.com/repos/owner/repo/pulls/42"
+        pr.head.sha = "abc"
+        pr.get_files.return_value = [_make_file("src/app.py")]
+
+        _analyze_file_changes(pr)
+        _analyze_file_changes(pr)
+        assert pr.get_files.call_count == 1
+
+        pr.head.sha = "def"
+        _analyze_file_changes(pr)
+        assert pr.get_files.call_count == 2
+
+
+class TestGraphQLSnapshot:
+    """Test the single-query GraphQL PR fetch"""
+
+    @patch.dict(os.environ, {"GITHUB_TOKEN": "test-token"})
+    def test_single_query_replaces_rest_calls(self):
+        """Test that PR data and files come from one GraphQL query in REST shape"""
+        with patch.object(github_helpers, 'Github') as mock_github_class:
+            mock_client = mock_github_class.return_value
+            mock_client.requester.graphql_query.return_value = _graphql_response(
+                [("src/app.py", 140, 10), ("config/settings.yaml", 20, 10)],
+                state="MERGED"
+            )
+
+            result = analyze_pr_nollm(42, "owner/repo")
+
+        mock_client.requester.graphql_query.assert_called_once()
+        assert mock_client.requester.graphql_query.call_args[0][1]["name"] == "repo"
+        mock_client.get_repo.assert_not_called()
+
+        pr_data = result["pr_data"]
+        assert pr_data["state"] == "closed"
+        assert pr_data["body"] == ""
+        assert pr_data["author"] == "octocat"
+        assert pr_data["created_at"] == "2024-05-01T12:00:00+00:00"
+        assert pr_data["mergeable"] is False
+        assert pr_data["mergeable_state"] == "dirty"
+        assert pr_data["commits"] == 3
+
+        files = result["files_analysis"]
+        assert files["total_files"] == 2
+        assert files["risk_files"] == ["config/settings.yaml"]
+        assert files["large_files"] == [
+            {"filename": "src/app.py", "changes": 150, "additions": 140, "deletions": 10}
+        ]
+
+    @patch.dict(os.environ, {"GITHUB_TOKEN": "test-token"})
+    def test_large_file_lists_fall_back_to_rest(self):
+        """Test that file lists longer than one GraphQL page are listed via REST"""
+        with patch.object(github_helpers, 'Github') as mock_github_class:
+            mock_client = mock_github_class.return_value
+            mock_client.requester.graphql_query.return_value = _graphql_response(
+                [("src/app.py", 1, 1)], has_next_page=True
+            )
+            pr = mock_client.get_repo.return_value.get_pull.return_value
+            pr.get_files.return_value = [_make_file("src/a.py"), _make_file("src/b.py")]
+
+            result = analyze_pr_nollm(42, "owner/repo")
+
+        pr.get_files.assert_called_once()
+        assert result["files_analysis"]["total_files"] == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,417 @@
+"""
+Unit Tests for Fast Text Analysis Tool
+
+Tests the analyze_text_nollm tool implementation:
+- Detector pooling and global educator reuse
+- Result caching
+- Batch analysis
+- Async dispatch off the event loop
+- Process pool worker logging
+- Result structure for detected and clean text
+- EducationalResponse serialization
+"""
+
+import pytest
+from dataclasses import asdict
+from unittest.mock import patch
+import logging
+import sys
+import os
+from logging.handlers import MemoryHandler, QueueHandler
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from vibe_check.tools import analyze_text_nollm
+from vibe_check.tools.analyze_text_nollm import (
+    analyze_text_demo,
+    analyze_text_demo_async,
+    analyze_texts_demo,
+    analyze_texts_demo_async,
+    lease_pattern_detector,
+    get_educational_generator,
+    reset_analysis_engines,
+    clear_result_cache,
+    _resolve_detail_level,
+)
+from vibe_check.core.educational_content import DetailLevel
+from vibe_check.core.pattern_detector import DetectionResult
+
+ANTI_PATTERN_TEXT = (
+    "We need to figure out how to do it ourselves since there is no documentation. "
+    "Before we start we need more research."
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_engines():
+    """Ensure each test starts with fresh global engine instances and cache"""
+    reset_analysis_engines()
+    clear_result_cache()
+    yield
+    reset_analysis_engines()
+    clear_result_cache()
+
+
+class TestGlobalEngineInstances:
+    """Test pooled detector and global educator instance management"""
+
+    def test_released_detector_is_reused(self):
+        """Test that sequential leases reuse the pooled detector"""
+        with patch.object(analyze_text_nollm, 'PatternDetector') as mock_detector_class:
+            with lease_pattern_detector() as detector1:
+                pass
+            with lease_pattern_detector() as detector2:
+                pass
+
+            assert detector1 is detector2
+            mock_detector_class.assert_called_once()
+
+    def test_concurrent_leases_get_distinct_detectors(self):
+        """Test that overlapping leases never share a detector"""
+        with patch.object(analyze_text_nollm, 'PatternDetector', side_effect=lambda: object()):
+            with lease_pattern_detector() as detector1:
+                with lease_pattern_detector() as detector2:
+                    assert detector1 is not detector2
+
+    def test_pool_size_is_bounded(self):
+        """Test that idle detectors beyond the pool limit are dropped"""
+        with patch.object(analyze_text_nollm, '_MAX_POOLED_DETECTORS', 1):
+            with patch.object(analyze_text_nollm, 'PatternDetector', side_effect=lambda: object()):
+                with lease_pattern_detector():
+                    with lease_pattern_detector():
+                        pass
+
+        assert analyze_text_nollm._detector_pool.qsize() == 1
+
+    def test_educator_singleton(self):
+        """Test that get_educational_generator returns the same instance"""
+        with patch.object(analyze_text_nollm, 'EducationalContentGenerator') as mock_educator_class:
+            educator1 = get_educational_generator()
+            educator2 = get_educational_generator()
+
+            assert educator1 is educator2
+            mock_educator_class.assert_called_once()
+
+    def test_engines_reused_across_calls(self):
+        """Test that repeated analysis does not rebuild the engines"""
+        with patch.object(analyze_text_nollm, 'PatternDetector', wraps=analyze_text_nollm.PatternDetector) as mock_detector_class:
+            analyze_text_demo("first call")
+            analyze_text_demo("second call")
+
+            mock_detector_class.assert_called_once()
+
+
+class TestAnalyzeTextDemo:
+    """Test analyze_text_demo result structure"""
+
+    def test_detected_patterns_include_educational_content(self):
+        """Test that detected patterns produce educational content"""
+        result = analyze_text_demo(ANTI_PATTERN_TEXT, "brief")
+
+        assert result["analysis_results"]["patterns_detected"] > 0
+        assert result["patterns"][0]["detected"] is True
+        assert result["educational_content"]["pattern_type"] == result["patterns"][0]["pattern_type"]
+
+    def test_educational_content_uses_first_detected_pattern(self):
+        """Test that undetected leading results do not suppress educational content"""
+        results = [
+            DetectionResult("complexity_escalation", False, 0.1, [], 0.5),
+            DetectionResult("documentation_neglect", True, 0.5, ["claims lack of documentation"], 0.4),
+        ]
+        with patch.object(analyze_text_nollm.PatternDetector, 'analyze_text_for_patterns', return_value=results):
+            result = analyze_text_demo("any text")
+
+        assert result["analysis_results"]["patterns_detected"] == 1
+        assert result["educational_content"]["pattern_type"] == "documentation_neglect"
+
+    @pytest.mark.parametrize("raw", ["1M", "", "0", "-5"])
+    def test_invalid_size_limit_falls_back_to_default(self, raw):
+        """Test that malformed or non-positive limits are ignored instead of failing import"""
+        with patch.dict(os.environ, {"VIBE_CHECK_MAX_TEXT_SIZE": raw}):
+            assert analyze_text_nollm._positive_int_env("VIBE_CHECK_MAX_TEXT_SIZE", 1024) == 1024
+
+    def test_valid_size_limit_is_used(self):
+        """Test that a positive integer limit is read from the environment"""
+        with patch.dict(os.environ, {"VIBE_CHECK_MAX_TEXT_SIZE": "2048"}):
+            assert analyze_text_nollm._positive_int_env("VIBE_CHECK_MAX_TEXT_SIZE", 1024) == 2048
+
+    def test_oversized_text_rejected(self):
+        """Test that texts over the size limit skip detection"""
+        with patch.object(analyze_text_nollm, '_MAX_TEXT_SIZE', 10):
+            with patch.object(analyze_text_nollm, '_analyze_text') as mock_analyze:
+                result = analyze_text_demo("x" * 11)
+
+        mock_analyze.assert_not_called()
+        assert "error" in result
+        assert result["analysis_results"]["text_length"] == 11
+        assert result["analysis_results"]["patterns_detected"] == 0
+
+    def test_clean_text(self):
+        """Test that clean text returns no patterns"""
+        result = analyze_text_demo("Use the official SDK as documented.")
+
+        assert result["analysis_results"]["patterns_detected"] == 0
+        assert result["patterns"] == []
+        assert result["educational_content"] == {}
+
+    def test_clean_text_skips_educational_generator(self):
+        """Test that the no-pattern fast path never builds educational content"""
+        with patch.object(analyze_text_nollm, 'get_educational_generator') as mock_get_educator:
+            result = analyze_text_demo("Use the official SDK as documented.")
+
+        mock_get_educator.assert_not_called()
+        assert result["analysis_results"]["analysis_method"] == "Phase 1 validated core engine"
+
+    def test_detail_level_none_skips_educational_content(self):
+        """Test that detail_level="none" returns detection results without educational content"""
+        with patch.object(analyze_text_nollm, 'get_educational_generator') as mock_get_educator:
+            result = analyze_text_demo(ANTI_PATTERN_TEXT, "none")
+
+        mock_get_educator.assert_not_called()
+        assert result["analysis_results"]["patterns_detected"] > 0
+        assert result["patterns"] == analyze_text_demo(ANTI_PATTERN_TEXT, "brief")["patterns"]
+        assert result["educational_content"] == {}
+
+    @pytest.mark.parametrize("detail_level,expected", [
+        ("brief", DetailLevel.BRIEF),
+        ("COMPREHENSIVE", DetailLevel.COMPREHENSIVE),
+        ("Standard", DetailLevel.STANDARD),
+        ("unknown", DetailLevel.STANDARD),
+        ("none", None),
+        ("NONE", None),
+    ])
+    def test_resolve_detail_level(self, detail_level, expected):
+        """Test case-insensitive detail level resolution with STANDARD fallback"""
+        assert _resolve_detail_level(detail_level) is expected
+
+
+class TestResultCache:
+    """Test caching of analysis results"""
+
+    def test_repeated_text_hits_cache(self):
+        """Test that identical requests only run detection once"""
+        with patch.object(analyze_text_nollm, '_analyze_text', wraps=analyze_text_nollm._analyze_text) as mock_analyze:
+            first = analyze_text_demo(ANTI_PATTERN_TEXT)
+            second = analyze_text_demo(ANTI_PATTERN_TEXT)
+
+            assert first == second
+            mock_analyze.assert_called_once()
+
+    def test_detail_level_is_part_of_key(self):
+        """Test that different detail levels are cached separately"""
+        with patch.object(analyze_text_nollm, '_analyze_text', wraps=analyze_text_nollm._analyze_text) as mock_analyze:
+            analyze_text_demo(ANTI_PATTERN_TEXT, "brief")
+            analyze_text_demo(ANTI_PATTERN_TEXT, "comprehensive")
+
+            assert mock_analyze.call_count == 2
+
+    def test_cached_result_not_affected_by_caller_mutation(self):
+        """Test that callers receive a copy of the cached result"""
+        first = analyze_text_demo(ANTI_PATTERN_TEXT)
+        expected_pattern = dict(first["patterns"][0])
+        first["patterns"][0]["detected"] = "mutated"
+        first["patterns"][0]["evidence"].append("mutated")
+        first["analysis_results"]["patterns_detected"] = -1
+        first["educational_content"]["severity"] = "mutated"
+
+        second = analyze_text_demo(ANTI_PATTERN_TEXT)
+        assert second["patterns"][0]["detected"] == expected_pattern["detected"]
+        assert second["educational_content"]["severity"] != "mutated"
+        assert "mutated" not in second["patterns"][0]["evidence"]
+        assert second["analysis_results"]["patterns_detected"] >= 0
+
+        first["patterns"] = "mutated"
+        third = analyze_text_demo(ANTI_PATTERN_TEXT)
+        assert third["patterns"] != "mutated"
+
+    def test_expired_entries_are_recomputed(self):
+        """Test that entries older than the TTL are not served"""
+        with patch.object(analyze_text_nollm, '_RESULT_CACHE_TTL_SECONDS', -1.0):
+            with patch.object(analyze_text_nollm, '_analyze_text', wraps=analyze_text_nollm._analyze_text) as mock_analyze:
+                analyze_text_demo(ANTI_PATTERN_TEXT)
+                analyze_text_demo(ANTI_PATTERN_TEXT)
+
+                assert mock_analyze.call_count == 2
+
+    def test_errors_are_not_cached(self):
+        """Test that failed analyses are retried on the next call"""
+        with patch.object(analyze_text_nollm, 'PatternDetector', side_effect=RuntimeError("boom")):
+            result = analyze_text_demo(ANTI_PATTERN_TEXT)
+            assert "error" in result
+
+        result = analyze_text_demo(ANTI_PATTERN_TEXT)
+        assert "error" not in result
+
+
+class TestAsyncAnalysis:
+    """Test async dispatch of text analysis"""
+
+    @pytest.mark.asyncio
+    async def test_async_matches_sync(self):
+        """Test that the async wrapper returns the same result as the sync tool"""
+        result = await analyze_text_demo_async(ANTI_PATTERN_TEXT, "brief")
+
+        assert result == analyze_text_demo(ANTI_PATTERN_TEXT, "brief")
+
+    @pytest.mark.asyncio
+    async def test_small_text_uses_default_executor(self):
+        """Test that small texts do not start the process pool"""
+        with patch.object(analyze_text_nollm, 'get_process_pool') as mock_pool:
+            await analyze_text_demo_async("short text")
+
+        mock_pool.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_text_served_from_parent_cache(self):
+        """Test that a cached large text is not shipped to a worker process"""
+        large_text = ANTI_PATTERN_TEXT * 200
+        expected = analyze_text_demo(large_text)
+
+        with patch.object(analyze_text_nollm, 'get_process_pool') as mock_pool:
+            result = await analyze_text_demo_async(large_text)
+
+        mock_pool.assert_not_called()
+        assert result == expected
+
+    @pytest.mark.asyncio
+    async def test_worker_result_stored_in_parent_cache(self):
+        """Test that a large text analyzed by a worker is cached in this process"""
+        large_text = ANTI_PATTERN_TEXT * 200
+        with patch.object(analyze_text_nollm, '_analyze_in_worker', wraps=analyze_text_nollm._analyze_text) as mock_worker:
+            first = await analyze_text_demo_async(large_text)
+            second = await analyze_text_demo_async(large_text)
+
+        mock_worker.assert_called_once()
+        assert first == second
+
+    def test_process_pool_does_not_fork(self):
+        """Test that workers are not forked from the multithreaded server"""
+        with patch.object(analyze_text_nollm, '_process_pool', None), \
+             patch.object(analyze_text_nollm, 'ProcessPoolExecutor') as mock_executor:
+            analyze_text_nollm.get_process_pool()
+
+        mp_context = mock_executor.call_args.kwargs["mp_context"]
+        assert mp_context.get_start_method() in ("forkserver", "spawn")
+
+    @pytest.mark.asyncio
+    async def test_batch_async_matches_sync(self):
+        """Test that the async batch wrapper returns the same results as the sync batch"""
+        texts = [ANTI_PATTERN_TEXT, "Use the official SDK as documented."]
+        results = await analyze_texts_demo_async(texts, "brief")
+
+        assert results == analyze_texts_demo(texts, "brief")
+
+
+class TestWorkerLogging:
+    """Test logging configuration in process pool workers"""
+
+    @pytest.fixture
+    def root_logger(self):
+        root = logging.getLogger()
+        handlers = list(root.handlers)
+        for handler in handlers:
+            root.removeHandler(handler)
+        yield root
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        for handler in handlers:
+            root.addHandler(handler)
+
+    def test_deferred_handlers_replaced_with_stderr(self, root_logger):
+        """Test that queue and buffer handlers are swapped for a direct stderr handler"""
+        root_logger.addHandler(QueueHandler(None))
+        root_logger.addHandler(MemoryHandler(capacity=10))
+
+        analyze_text_nollm._init_worker_logging()
+
+        assert not any(isinstance(h, (QueueHandler, MemoryHandler)) for h in root_logger.handlers)
+        stream_handlers = [h for h in root_logger.handlers if type(h) is logging.StreamHandler]
+        assert len(stream_handlers) == 1
+        assert stream_handlers[0].stream is sys.stderr
+
+    def test_direct_handlers_left_alone(self, root_logger):
+        """Test that workers already logging directly are unchanged"""
+        handler = logging.StreamHandler()
+        root_logger.addHandler(handler)
+
+        analyze_text_nollm._init_worker_logging()
+
+        assert [h for h in root_logger.handlers if type(h) is logging.StreamHandler] == [handler]
+
+
+class TestBatchAnalysis:
+    """Test batch analysis of multiple texts"""
+
+    def test_batch_matches_single_calls(self):
+        """Test that each batch result equals the single-text result, in order"""
+        texts = [ANTI_PATTERN_TEXT, "Use the official SDK as documented.", ANTI_PATTERN_TEXT]
+        results = analyze_texts_demo(texts, "brief")
+
+        assert results == [analyze_text_demo(text, "brief") for text in texts]
+
+    def test_empty_batch(self):
+        """Test that an empty batch returns an empty list"""
+        assert analyze_texts_demo([]) == []
+
+    def test_oversized_text_only_rejects_that_entry(self):
+        """Test that the size limit applies per text"""
+        with patch.object(analyze_text_nollm, '_MAX_TEXT_SIZE', 200):
+            results = analyze_texts_demo(["x" * 201, ANTI_PATTERN_TEXT])
+
+        assert "error" in results[0]
+        assert "error" not in results[1]
+
+    def test_too_many_texts_rejected(self):
+        """Test that batches over the text count limit skip detection"""
+        with patch.object(analyze_text_nollm, '_MAX_BATCH_TEXTS', 2):
+            with patch.object(analyze_text_nollm, '_analyze_text') as mock_analyze:
+                results = analyze_texts_demo(["a", "b", "c"])
+
+        mock_analyze.assert_not_called()
+        assert len(results) == 1
+        assert "Too many texts" in results[0]["error"]
+        assert results[0]["analysis_results"]["patterns_detected"] == 0
+
+    def test_batch_total_size_rejected(self):
+        """Test that texts each under the single limit cannot exceed it together"""
+        with patch.object(analyze_text_nollm, '_MAX_TEXT_SIZE', 200), \
+             patch.object(analyze_text_nollm, '_MAX_BATCH_SIZE', 200):
+            with patch.object(analyze_text_nollm, '_analyze_text') as mock_analyze:
+                results = analyze_texts_demo(["x" * 150, "y" * 150])
+
+        mock_analyze.assert_not_called()
+        assert "Batch too large" in results[0]["error"]
+        assert results[0]["analysis_results"]["text_length"] == 300
+
+    @pytest.mark.asyncio
+    async def test_async_batch_rejected_before_dispatch(self):
+        """Test that oversized batches never reach an executor"""
+        with patch.object(analyze_text_nollm, '_MAX_BATCH_SIZE', 10):
+            with patch.object(analyze_text_nollm, 'get_process_pool') as mock_pool:
+                results = await analyze_texts_demo_async(["x" * 20_000])
+
+        mock_pool.assert_not_called()
+        assert "Batch too large" in results[0]["error"]
+
+
+class TestEducationalResponseSerialization:
+    """Test EducationalResponse.to_dict matches dataclasses.asdict"""
+
+    @pytest.mark.parametrize("pattern_type", [
+        "infrastructure_without_implementation",
+        "documentation_neglect",
+    ])
+    def test_to_dict_matches_asdict(self, pattern_type):
+        """Test that to_dict produces the same shape as asdict"""
+        response = get_educational_generator().generate_educational_response(
+            pattern_type=pattern_type,
+            confidence=0.8,
+            evidence=["test evidence"]
+        )
+
+        assert response.to_dict() == asdict(response)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,102 @@
+"""
+Unit Tests for GitHub Object Cache
+
+Tests the TTL/conditional-request cache used by the GitHub analysis tools:
+- Fresh entries are served without fetching
+- Expired PyGithub objects are revalidated with update()
+- Failed revalidation and fetch errors fall back correctly
+- LRU eviction
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import MagicMock
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from github import GithubException
+from github.GithubObject import CompletableGithubObject
+
+from vibe_check.tools.shared.github_cache import GitHubObjectCache
+
+
+def _github_object():
+    return MagicMock(spec=CompletableGithubObject)
+
+
+class TestGitHubObjectCache:
+    """Test GitHubObjectCache behavior"""
+
+    def test_fresh_entry_served_without_fetch(self):
+        """Test that a second lookup within the TTL does not fetch"""
+        cache = GitHubObjectCache()
+        fetch = MagicMock(return_value=_github_object())
+
+        first = cache.get_or_fetch("key", fetch, ttl=60)
+        second = cache.get_or_fetch("key", fetch, ttl=60)
+
+        assert first is second
+        fetch.assert_called_once()
+
+    def test_expired_object_is_revalidated(self):
+        """Test that expired PyGithub objects use a conditional request instead of refetching"""
+        cache = GitHubObjectCache()
+        obj = _github_object()
+        obj.update.return_value = False  # 304 Not Modified
+        fetch = MagicMock(return_value=obj)
+
+        cache.get_or_fetch("key", fetch, ttl=0)
+        result = cache.get_or_fetch("key", fetch, ttl=60)
+
+        assert result is obj
+        fetch.assert_called_once()
+        obj.update.assert_called_once()
+
+        # Revalidation refreshed the TTL
+        cache.get_or_fetch("key", fetch, ttl=60)
+        obj.update.assert_called_once()
+
+    def test_failed_revalidation_refetches(self):
+        """Test that a revalidation error falls back to a full fetch"""
+        cache = GitHubObjectCache()
+        stale = _github_object()
+        stale.update.side_effect = GithubException(404, {"message": "Not Found"})
+        fresh = _github_object()
+        fetch = MagicMock(side_effect=[stale, fresh])
+
+        cache.get_or_fetch("key", fetch, ttl=0)
+        assert cache.get_or_fetch("key", fetch, ttl=60) is fresh
+
+    def test_expired_plain_values_are_refetched(self):
+        """Test that non-PyGithub values are refetched once expired"""
+        cache = GitHubObjectCache()
+        fetch = MagicMock(side_effect=[["a"], ["b"]])
+
+        assert cache.get_or_fetch("key", fetch, ttl=0) == ["a"]
+        assert cache.get_or_fetch("key", fetch, ttl=60) == ["b"]
+
+    def test_fetch_errors_are_not_cached(self):
+        """Test that failed fetches propagate and are retried"""
+        cache = GitHubObjectCache()
+        fetch = MagicMock(side_effect=[GithubException(500, {"message": "boom"}), ["ok"]])
+
+        with pytest.raises(GithubException):
+            cache.get_or_fetch("key", fetch, ttl=60)
+        assert cache.get_or_fetch("key", fetch, ttl=60) == ["ok"]
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted when full"""
+        cache = GitHubObjectCache(max_entries=2)
+        cache.get_or_fetch("a", lambda: "A", ttl=60)
+        cache.get_or_fetch("b", lambda: "B", ttl=60)
+        cache.get_or_fetch("a", lambda: "A2", ttl=60)
+        cache.get_or_fetch("c", lambda: "C", ttl=60)
+
+        assert cache.get_or_fetch("a", lambda: "A3", ttl=60) == "A"
+        assert cache.get_or_fetch("b", lambda: "B2", ttl=60) == "B2"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -5,10 +5,12 @@ Tests the official alternative checking mechanism that prevents unnecessary
 custom development by validating integration approaches against official solutions.
 """
 
+import dataclasses
 import pytest
 import json
+import sys
 from pathlib import Path
-from unittest.mock import patch, mock_open
+from unittest.mock import patch, mock_open, MagicMock
 
 from src.vibe_check.tools.integration_decision_check import (
     IntegrationKnowledgeBase,
@@ -17,8 +19,21 @@ from src.vibe_check.tools.integration_decision_check import (
     calculate_warning_level,
     generate_decision_matrix,
     generate_validation_questions,
-    generate_recommendation
+    generate_recommendation,
+    CUSTOM_WORK_INDICATORS,
+    HYPERSCAN_AVAILABLE,
+    _find_terms,
+    reset_official_alternatives_cache
 )
+from src.vibe_check.tools import integration_decision_check
+
+
+@pytest.fixture(autouse=True)
+def clear_alternatives_cache():
+    """Ensure each test sees its own (possibly mocked) knowledge base"""
+    reset_official_alternatives_cache()
+    yield
+    reset_official_alternatives_cache()
 
 
 @pytest.fixture
@@ -277,6 +292,56 @@ class TestOfficialAlternativesCheck:
         assert result.warning_level == "caution"
         assert len(result.official_solutions) == 0
         assert "Research required" in result.recommendation
+    
+    @patch.object(IntegrationKnowledgeBase, '_load_knowledge_base')
+    def test_repeat_check_is_memoized(self, mock_load, sample_knowledge_base):
+        """Test that identical checks reuse the first result without reloading the knowledge base."""
+        mock_load.return_value = sample_knowledge_base
+        
+        result1 = check_official_alternatives("cognee", ["custom REST server", "storage"])
+        loads_after_first_call = mock_load.call_count
+        result2 = check_official_alternatives("cognee", ["custom REST server", "storage"])
+        
+        assert result1 is result2
+        assert mock_load.call_count == loads_after_first_call
+        
+        # Technology casing is echoed back, so it is part of the key
+        result3 = check_official_alternatives("Cognee", ["custom REST server", "storage"])
+        assert result3.technology == "Cognee"
+    
+    def test_recommendation_is_immutable(self):
+        """Test that shared (memoized) recommendations cannot be modified."""
+        result = check_official_alternatives("cognee", ["custom feature"])
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.warning_level = "none"
+        if sys.version_info >= (3, 10):
+            assert not hasattr(result, "__dict__")
+    
+    def test_to_dict_matches_fields(self):
+        """Test that to_dict covers every field in declaration order."""
+        result = check_official_alternatives("cognee", ["custom REST server"])
+        
+        as_dict = result.to_dict()
+        assert list(as_dict) == [field.name for field in dataclasses.fields(result)]
+        # Tuple fields come back as lists, so compare the JSON-equivalent forms
+        assert as_dict == json.loads(json.dumps(dataclasses.asdict(result)))
+    
+    def test_to_dict_mutation_does_not_leak(self):
+        """Test that mutating a returned dict cannot corrupt later memoized results."""
+        features = ["custom REST server", "JWT authentication"]
+        expected = check_official_alternatives("cognee", features).to_dict()
+        
+        as_dict = check_official_alternatives("cognee", features).to_dict()
+        as_dict["official_solutions"].clear()
+        as_dict["next_steps"].append("tampered")
+        as_dict["decision_matrix"]["options"][0]["pros"].clear()
+        as_dict["decision_matrix"]["criteria"] = []
+        
+        fresh = check_official_alternatives("cognee", features)
+        assert fresh.to_dict() == expected
+        assert isinstance(fresh.next_steps, tuple)
+        assert isinstance(fresh.official_solutions, tuple)
 
 
 class TestIntegrationTextAnalysis:
@@ -321,6 +386,44 @@ class TestIntegrationTextAnalysis:
         assert result["warning_level"] == "none"
 
 
+class TestTermMatching:
+    """Test literal term detection used by integration text analysis."""
+    
+    def test_overlapping_terms_all_detected(self):
+        """Test that terms nested in other terms are still reported, in term order."""
+        text = "we will add authentication to the rest api server"
+        
+        assert _find_terms(text, CUSTOM_WORK_INDICATORS) == [
+            "server", "api", "rest", "authentication", "auth"
+        ]
+    
+    @pytest.mark.skipif(not HYPERSCAN_AVAILABLE, reason="hyperscan not installed")
+    def test_long_text_scan_matches_substring_search(self):
+        """Test that the single-pass scan for long texts matches plain substring search."""
+        terms = CUSTOM_WORK_INDICATORS + ("cognee", "supabase", "c++ sdk")
+        text = ("padding text über alles " * 200) + "a custom c++ sdk for supabase with jwt storage"
+        assert len(text) >= 4096
+        
+        assert _find_terms(text, terms) == [term for term in terms if term in text]
+    
+    def test_scan_error_falls_back_to_substring_search(self):
+        """Test that a Hyperscan scan error is logged and substring search is used."""
+        class FakeHyperscanError(Exception):
+            pass
+        
+        terms = ("custom", "sdk")
+        text = ("padding " * 600) + "a custom sdk"
+        database = MagicMock()
+        database.scan.side_effect = FakeHyperscanError("scan failed")
+        
+        with patch.object(integration_decision_check, 'HYPERSCAN_AVAILABLE', True), \
+             patch.object(integration_decision_check, 'hyperscan', MagicMock(error=FakeHyperscanError), create=True), \
+             patch.dict(integration_decision_check._term_databases, {terms: database}):
+            assert _find_terms(text, terms) == ["custom", "sdk"]
+        
+        database.scan.assert_called_once()
+
+
 class TestEdgeCases:
     """Test edge cases and error conditions."""
     
@@ -0,0 +1,62 @@
+"""
+Unit Tests for JSON Serialization Helpers
+
+Tests that the tool result serializer produces the same output as
+FastMCP's default serializer, with and without orjson installed.
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from fastmcp.tools.tool import default_serializer
+
+from vibe_check.core.educational_content import DetailLevel
+from vibe_check.core.pattern_detector import DetectionResult
+from vibe_check.utils import json_serialization
+from vibe_check.utils.json_serialization import serialize_tool_result, loads
+
+
+class Opaque:
+    """Value with no JSON encoding, serialized via str()"""
+
+    def __str__(self):
+        return "opaque"
+
+
+SAMPLE_RESULTS = [
+    {"status": "success", "items": [1, 2.5, "✅ unicode"], "empty": None},
+    {"level": DetailLevel.BRIEF},
+    {"result": DetectionResult("documentation_neglect", True, 0.5, ["evidence"], 0.4)},
+    [{"nested": {"deep": [True, False]}}],
+    {"tags": {"single"}, "raw": b"bytes"},
+    {"unknown": Opaque()},
+]
+
+
+class TestSerializeToolResult:
+    """Test tool result serialization"""
+
+    @pytest.mark.parametrize("data", SAMPLE_RESULTS)
+    def test_matches_fastmcp_default(self, data):
+        """Test output is identical to FastMCP's default serializer"""
+        assert serialize_tool_result(data) == default_serializer(data)
+
+    @pytest.mark.parametrize("data", SAMPLE_RESULTS)
+    def test_matches_fastmcp_default_without_orjson(self, data):
+        """Test the fallback path is identical to FastMCP's default serializer"""
+        with patch.object(json_serialization, 'ORJSON_AVAILABLE', False):
+            assert serialize_tool_result(data) == default_serializer(data)
+
+    def test_round_trip(self):
+        """Test serialized results parse back to the same data"""
+        data = {"status": "success", "count": 3, "tags": ["a", "b"]}
+        assert loads(serialize_tool_result(data)) == data
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,132 @@
+"""
+Unit Tests for Core Pattern Detector Matching
+
+Tests the indicator matching paths of PatternDetector:
+- Precompiled re fallback
+- Optional Hyperscan single-pass matching gives identical results
+- Concurrent Hyperscan scans on a shared detector
+- Slotted result dataclasses
+"""
+
+import pytest
+import sys
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from vibe_check.core import pattern_detector
+from vibe_check.core.pattern_detector import PatternDetector
+
+SAMPLE_TEXTS = [
+    "We need to figure out how to do it ourselves since there is no documentation.",
+    "Planning to build our own custom HTTP client instead of using the official SDK.",
+    "Quick fix workaround for now, we will handle it temporarily.",
+    "We are evaluating options: on the other hand, maybe we should use the SDK.",
+    "Use the official SDK as documented.",
+]
+
+
+@pytest.fixture(scope="module")
+def detector():
+    return PatternDetector()
+
+
+class TestIndicatorMatching:
+    """Test indicator matching backends"""
+
+    def test_regex_fallback_without_hyperscan(self, detector, monkeypatch):
+        """Test that detection works when multi-pattern scanning is unavailable"""
+        monkeypatch.setattr(detector, '_multi_pattern_disabled', True)
+
+        assert detector._scan_all_indicators("any text") is None
+        results = detector.analyze_text_for_patterns(SAMPLE_TEXTS[0])
+        assert any(r.pattern_type == "documentation_neglect" for r in results)
+
+    @pytest.mark.skipif(not pattern_detector.HYPERSCAN_AVAILABLE, reason="hyperscan not installed")
+    @pytest.mark.parametrize("text", SAMPLE_TEXTS)
+    def test_hyperscan_matches_regex(self, detector, text):
+        """Test that Hyperscan matching produces the same results as re"""
+        text_lower = text.lower()
+        matched = detector._scan_all_indicators(text_lower)
+        assert matched is not None
+
+        for pattern_config in detector.patterns.values():
+            fast = detector._detect_single_pattern(text, pattern_config, text_lower, matched)
+            slow = detector._detect_single_pattern(text, pattern_config, text_lower)
+            assert (fast.confidence, fast.evidence) == (slow.confidence, slow.evidence)
+
+    @pytest.mark.parametrize("text", SAMPLE_TEXTS)
+    def test_precomputed_content_bytes(self, detector, text):
+        """Test that passing pre-encoded content bytes does not change results"""
+        expected = detector.analyze_text_for_patterns(text)
+        results = detector.analyze_text_for_patterns(text, content_bytes=text.encode("utf-8"))
+
+        assert [(r.pattern_type, r.confidence, r.evidence) for r in results] == \
+            [(r.pattern_type, r.confidence, r.evidence) for r in expected]
+
+
+@pytest.mark.skipif(not pattern_detector.HYPERSCAN_AVAILABLE, reason="hyperscan not installed")
+class TestConcurrentScanning:
+    """Test that one detector can be shared by threads, as the GitHub analyzers do"""
+
+    def test_first_scans_build_database_once(self):
+        """Test that racing first scans compile one database and all see its keys"""
+        detector = PatternDetector()
+        expected = PatternDetector()._scan_all_indicators(SAMPLE_TEXTS[1].lower())
+        barrier = threading.Barrier(8)
+
+        def scan(_):
+            barrier.wait()
+            return detector._scan_all_indicators(SAMPLE_TEXTS[1].lower())
+
+        with patch.object(pattern_detector.hyperscan, 'Database', wraps=pattern_detector.hyperscan.Database) as mock_database:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(scan, range(8)))
+
+        mock_database.assert_called_once()
+        assert results == [expected] * 8
+
+    def test_threads_scan_with_their_own_scratch(self, detector):
+        """Test that concurrent scans do not share Hyperscan scratch space"""
+        expected = [detector._scan_all_indicators(text.lower()) for text in SAMPLE_TEXTS]
+        barrier = threading.Barrier(4)
+
+        def scan(_):
+            barrier.wait()
+            results = [detector._scan_all_indicators(text.lower()) for text in SAMPLE_TEXTS * 50]
+            return results, detector._scan_scratch.scratch
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outcomes = list(executor.map(scan, range(4)))
+
+        for results, _ in outcomes:
+            assert results == expected * 50
+        assert len({id(scratch) for _, scratch in outcomes}) == 4
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots require Python 3.10+")
+class TestSlottedResults:
+    """Test that result dataclasses do not carry a per-instance __dict__"""
+
+    def test_detection_result_has_no_dict(self, detector):
+        """Test DetectionResult instances are slotted"""
+        results = detector.analyze_text_for_patterns(SAMPLE_TEXTS[0])
+        assert results
+        assert not hasattr(results[0], "__dict__")
+
+    def test_educational_response_has_no_dict(self, detector):
+        """Test EducationalResponse instances are slotted"""
+        response = detector.educational_generator.generate_educational_response(
+            pattern_type="documentation_neglect",
+            confidence=0.5,
+            evidence=["claims lack of documentation"]
+        )
+        assert not hasattr(response, "__dict__")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,175 @@
+"""
+Unit Tests for the Optional Semantic Result Cache
+
+Tests the feature flag and optional dependency handling:
+- Disabled by default
+- Graceful fallback when faiss/sentence-transformers are missing, the model
+  fails to load, or embedding fails
+- Near-duplicate hits return independent copies describing the new input
+"""
+
+import math
+import pytest
+from unittest.mock import patch
+import sys
+import os
+import types
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from vibe_check.tools.shared import semantic_cache
+from vibe_check.tools import analyze_text_nollm
+
+
+@pytest.fixture(autouse=True)
+def reset_semantic_cache():
+    """Reset global semantic cache state between tests"""
+    semantic_cache._semantic_cache = None
+    semantic_cache._semantic_cache_unavailable = False
+    yield
+    semantic_cache._semantic_cache = None
+    semantic_cache._semantic_cache_unavailable = False
+
+
+class TestSemanticCacheFlag:
+    """Test semantic cache enablement"""
+
+    def test_disabled_by_default(self):
+        """Test that no cache is created when the flag is off"""
+        with patch.object(semantic_cache, 'SEMANTIC_CACHE_ENABLED', False):
+            with patch.object(semantic_cache, 'SemanticResultCache') as mock_cache_class:
+                assert semantic_cache.get_semantic_cache() is None
+                mock_cache_class.assert_not_called()
+
+    def test_missing_dependencies_disable_cache(self):
+        """Test that missing optional dependencies fall back to no cache"""
+        with patch.object(semantic_cache, 'SEMANTIC_CACHE_ENABLED', True):
+            with patch.object(semantic_cache, 'SemanticResultCache', side_effect=ImportError("faiss")) as mock_cache_class:
+                assert semantic_cache.get_semantic_cache() is None
+                assert semantic_cache.get_semantic_cache() is None
+
+                # Import is only attempted once
+                mock_cache_class.assert_called_once()
+
+    def test_model_load_failure_disables_cache(self):
+        """Test that a failed model load falls back to no cache without retrying"""
+        with patch.object(semantic_cache, 'SEMANTIC_CACHE_ENABLED', True):
+            with patch.object(semantic_cache, 'SemanticResultCache', side_effect=OSError("model not found")) as mock_cache_class:
+                assert semantic_cache.get_semantic_cache() is None
+                assert semantic_cache.get_semantic_cache() is None
+
+                mock_cache_class.assert_called_once()
+
+    def test_embedding_failure_falls_back_to_compute(self, fake_semantic_cache):
+        """Test that an encoder error computes the result instead of failing"""
+        with patch.object(FakeModel, 'encode', side_effect=RuntimeError("encoder failed")):
+            result = fake_semantic_cache.get_or_compute("some text", "standard", lambda: {"patterns": []})
+
+        assert result == {"patterns": []}
+
+    def test_enabled_cache_is_singleton(self):
+        """Test that the enabled cache is created once and reused"""
+        with patch.object(semantic_cache, 'SEMANTIC_CACHE_ENABLED', True):
+            with patch.object(semantic_cache, 'SemanticResultCache') as mock_cache_class:
+                cache1 = semantic_cache.get_semantic_cache()
+                cache2 = semantic_cache.get_semantic_cache()
+
+                assert cache1 is cache2
+                mock_cache_class.assert_called_once()
+
+
+class FakeVector(list):
+    """Row vector stand-in for the float32 numpy arrays the cache passes around"""
+
+    def astype(self, dtype):
+        return self
+
+
+class FakeModel:
+    """Embeds text as letter frequencies, so near-duplicates score close to 1.0"""
+
+    def __init__(self, model_name):
+        pass
+
+    def get_sentence_embedding_dimension(self):
+        return 26
+
+    def encode(self, texts, convert_to_numpy=True):
+        counts = [0.0] * 26
+        for char in texts[0].lower():
+            if "a" <= char <= "z":
+                counts[ord(char) - ord("a")] += 1
+        return FakeVector([counts])
+
+
+class FakeIndex:
+    """Inner-product flat index over FakeVector rows"""
+
+    def __init__(self, dimension):
+        self.rows = []
+
+    @property
+    def ntotal(self):
+        return len(self.rows)
+
+    def add(self, vector):
+        self.rows.extend(vector)
+
+    def search(self, vector, k):
+        scores = [sum(a * b for a, b in zip(vector[0], row)) for row in self.rows]
+        best = max(range(len(scores)), key=scores.__getitem__)
+        return [[scores[best]]], [[best]]
+
+
+def _normalize_l2(vector):
+    for row in vector:
+        norm = math.sqrt(sum(x * x for x in row)) or 1.0
+        row[:] = [x / norm for x in row]
+
+
+@pytest.fixture
+def fake_semantic_cache():
+    """A real SemanticResultCache backed by fake faiss and sentence-transformers modules"""
+    fake_faiss = types.SimpleNamespace(IndexFlatIP=FakeIndex, normalize_L2=_normalize_l2)
+    fake_st = types.SimpleNamespace(SentenceTransformer=FakeModel)
+    with patch.dict(sys.modules, {"faiss": fake_faiss, "sentence_transformers": fake_st}):
+        yield semantic_cache.SemanticResultCache(similarity_threshold=0.95)
+
+
+class TestSemanticCacheHits:
+    """Test results served for near-duplicate texts"""
+
+    def test_hit_returns_independent_copy(self, fake_semantic_cache):
+        """Test that mutating a served result does not change the cached entry"""
+        stored = {"patterns": [{"evidence": ["custom auth"]}]}
+        fake_semantic_cache.get_or_compute("build a custom auth server", "standard", lambda: stored)
+        stored["patterns"][0]["evidence"].append("mutated after store")
+
+        hit = fake_semantic_cache.get_or_compute("build a custom auth server!", "standard", lambda: {})
+        hit["patterns"][0]["evidence"].clear()
+
+        again = fake_semantic_cache.get_or_compute("build a custom auth server?", "standard", lambda: {})
+        assert again["patterns"][0]["evidence"] == ["custom auth"]
+
+    def test_near_duplicate_reports_its_own_length(self, fake_semantic_cache):
+        """Test that a near-duplicate of different length is described as itself"""
+        original = "We will build a custom HTTP client instead of the official SDK for stripe"
+        near_duplicate = original + " soon"
+        analyze_text_nollm.clear_result_cache()
+
+        with patch.object(analyze_text_nollm, 'get_semantic_cache', return_value=fake_semantic_cache):
+            first = analyze_text_nollm.analyze_text_demo(original)
+            with patch.object(analyze_text_nollm, '_analyze_text') as mock_analyze:
+                second = analyze_text_nollm.analyze_text_demo(near_duplicate)
+        analyze_text_nollm.clear_result_cache()
+
+        mock_analyze.assert_not_called()
+        assert first["analysis_results"]["text_length"] == len(original)
+        assert second["analysis_results"]["text_length"] == len(near_duplicate)
+        assert "near-duplicate" in second["analysis_results"]["analysis_method"]
+        assert "near-duplicate" not in first["analysis_results"]["analysis_method"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
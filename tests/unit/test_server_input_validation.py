@@ -0,0 +1,101 @@
+"""
+Unit Tests for MCP Tool Input Guards
+
+Tests that obviously invalid tool arguments are rejected up front:
+- Malformed repositories never reach the GitHub-backed analyzers
+- Empty technology names never reach the integration analysis
+- Integration tool errors share one response shape
+"""
+
+import pytest
+import sys
+import os
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from vibe_check import server
+
+
+class TestRepositoryGuard:
+    """Test repository format validation for GitHub tools"""
+
+    @pytest.mark.parametrize("repository", ["", "owner", "owner/repo/extra", "owner repo", "https://github.com/owner/repo"])
+    @pytest.mark.asyncio
+    async def test_pr_tool_rejects_malformed_repository(self, repository):
+        """Test that the PR tool returns an error without fetching anything"""
+        with patch.object(server, 'analyze_pr_nollm_function') as mock_analyze:
+            result = await server.analyze_pr_nollm.fn(42, repository)
+
+        mock_analyze.assert_not_called()
+        assert result["success"] is False
+        assert "owner/repo" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_issue_tool_rejects_malformed_repository(self):
+        """Test that the issue tool returns an error without fetching anything"""
+        with patch.object(server, 'analyze_github_issue_tool') as mock_analyze:
+            result = await server.analyze_issue_nollm.fn(23, "not-a-repo")
+
+        mock_analyze.assert_not_called()
+        assert result["status"] == "vibe_check_error"
+        assert result["repository"] == "not-a-repo"
+
+    @pytest.mark.asyncio
+    async def test_valid_repository_is_analyzed(self):
+        """Test that well-formed repositories are passed through"""
+        with patch.object(server, 'analyze_pr_nollm_function', return_value={"success": True}) as mock_analyze:
+            result = await server.analyze_pr_nollm.fn(42, "kesslerio/vibe-check.mcp_2")
+
+        mock_analyze.assert_called_once()
+        assert result == {"success": True}
+
+
+class TestTechnologyGuard:
+    """Test technology validation for integration tools"""
+
+    @pytest.mark.parametrize("tool", [
+        server.check_integration_alternatives,
+        server.integration_decision_framework,
+        server.integration_research_with_websearch,
+    ])
+    def test_empty_technology_rejected(self, tool):
+        """Test that an empty technology returns an error before any analysis"""
+        with patch.object(server, 'check_official_alternatives') as mock_check:
+            result = tool.fn("  ", "custom auth")
+
+        mock_check.assert_not_called()
+        assert result["status"] == "error"
+        assert "Technology name cannot be empty" in result["message"]
+
+
+class TestIntegrationErrors:
+    """Test the shared integration error response"""
+
+    def test_validation_error_response(self):
+        """Test that validation failures report the technology and a recommendation"""
+        with patch.object(server, 'check_official_alternatives', side_effect=server.ValidationError("bad input")):
+            result = server.check_integration_alternatives.fn("cognee", "custom auth")
+
+        assert result == {
+            "status": "error",
+            "message": "Input validation failed: bad input",
+            "technology": "cognee",
+            "recommendation": "Please check your input parameters"
+        }
+
+    def test_recommendation_is_optional(self):
+        """Test that research validation errors keep their recommendation-free shape"""
+        with patch.object(server, 'check_official_alternatives', side_effect=server.ValidationError("bad input")):
+            result = server.integration_research_with_websearch.fn("cognee", "custom auth")
+
+        assert result == {
+            "status": "error",
+            "message": "Input validation failed: bad input",
+            "technology": "cognee"
+        }
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,101 @@
+"""
+Unit Tests for Deferred MCP Tool Registration
+
+Tests that importing and starting the server module stays cheap:
+- Importing vibe_check.server does not load the Claude CLI tool modules
+- Accessing server.mcp registers the deferred tool sets exactly once
+- main() only builds the argument parser when flags are given
+- Dev tools load by file path without touching sys.path
+"""
+
+import pytest
+import sys
+import os
+import asyncio
+import subprocess
+from unittest.mock import patch
+
+# Add src to path for testing
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+from vibe_check import server
+
+
+class TestLazyRegistration:
+    """Test that side-effectful tool registration waits for server.mcp"""
+
+    def test_import_skips_deferred_tool_modules(self):
+        """Test that a fresh import leaves the diagnostic and LLM tool modules unloaded"""
+        code = (
+            "import sys, vibe_check.server; "
+            "print('vibe_check.tools.diagnostics_claude_cli' in sys.modules, "
+            "'vibe_check.tools.analyze_llm.tool_registry' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True, text=True, timeout=60,
+            env={**os.environ, "PYTHONPATH": SRC_DIR}
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip().splitlines()[-1] == "False False"
+
+    def test_mcp_access_registers_tools_once(self):
+        """Test that server.mcp is the built server and repeated access reuses it"""
+        mcp = server.mcp
+        tools = asyncio.run(mcp.get_tools())
+
+        assert mcp is server._build_mcp()
+        assert "claude_cli_status" in tools
+        assert "server_status" in tools
+        assert len(asyncio.run(server.mcp.get_tools())) == len(tools)
+
+    def test_unknown_attribute_raises(self):
+        """Test that module __getattr__ only serves mcp"""
+        with pytest.raises(AttributeError):
+            server.not_a_server_attribute
+
+
+class TestEntryPoint:
+    """Test main() argument handling"""
+
+    def test_no_flags_skips_parser(self):
+        """Test that a bare launch starts the server without building a parser"""
+        with patch.object(sys, 'argv', ['vibe-check-mcp']), \
+             patch.object(server, '_build_parser') as mock_build, \
+             patch.object(server, 'run_server') as mock_run:
+            server.main()
+
+        mock_build.assert_not_called()
+        mock_run.assert_called_once_with()
+
+    def test_flags_are_parsed(self):
+        """Test that CLI flags are passed through to run_server"""
+        with patch.object(sys, 'argv', ['vibe-check-mcp', '--transport', 'streamable-http', '--port', '9000']), \
+             patch.object(server, 'run_server') as mock_run:
+            server.main()
+
+        mock_run.assert_called_once_with(transport="streamable-http", host=None, port=9000)
+
+
+class TestDevToolsLoading:
+    """Test loading the development test suite"""
+
+    def test_loads_without_sys_path_change(self):
+        """Test that the dev tools module loads by path and leaves sys.path alone"""
+        path_before = list(sys.path)
+        module = server._load_dev_tools_module()
+
+        assert callable(module.register_dev_tools)
+        assert sys.path == path_before
+
+    def test_missing_suite_raises_import_error(self, tmp_path):
+        """Test that a missing suite surfaces as ImportError for the dev mode fallback"""
+        with patch.object(server, '_PKG_ROOT', tmp_path):
+            with pytest.raises(ImportError):
+                server._load_dev_tools_module()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,78 @@
+"""
+Unit Tests for Server Logging Setup
+
+Tests that buffered log records are not lost outside normal shutdown:
+- SIGTERM drains the queue and file buffer before terminating
+- Forked children log directly instead of through the listener queue
+- Warnings flush the file buffer immediately
+"""
+
+import pytest
+import sys
+import os
+import logging
+import signal
+from unittest.mock import patch
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from vibe_check import server
+
+
+@pytest.fixture
+def restore_root_handlers():
+    """Restore the root logger's handlers after a test rewires them"""
+    root = logging.getLogger()
+    handlers = list(root.handlers)
+    yield root
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    for handler in handlers:
+        root.addHandler(handler)
+
+
+class TestSigtermFlush:
+    """Test the SIGTERM log flush handler"""
+
+    def test_flushes_then_redelivers_signal(self):
+        """Test that logs are drained before the default SIGTERM action runs"""
+        calls = []
+        with patch.object(server, '_stop_log_listener', side_effect=lambda: calls.append("stop")), \
+             patch.object(server.signal, 'signal', side_effect=lambda *a: calls.append(("signal",) + a)), \
+             patch.object(server.os, 'kill', side_effect=lambda *a: calls.append(("kill",) + a)):
+            server._flush_logs_on_sigterm(signal.SIGTERM, None)
+
+        assert calls == [
+            "stop",
+            ("signal", signal.SIGTERM, signal.SIG_DFL),
+            ("kill", os.getpid(), signal.SIGTERM)
+        ]
+
+
+class TestForkedChildLogging:
+    """Test logging in forked children"""
+
+    def test_child_logs_without_queue(self, restore_root_handlers):
+        """Test that the child swaps the queue handler for direct handlers"""
+        root = restore_root_handlers
+        root.addHandler(server._log_queue_handler)
+
+        server._log_directly_in_child()
+
+        assert server._log_queue_handler not in root.handlers
+        assert server._log_stream_handler in root.handlers
+        assert server._log_file_handler in root.handlers
+        assert server._log_file_buffer not in root.handlers
+
+
+class TestFileBuffer:
+    """Test file write batching"""
+
+    def test_warnings_flush_immediately(self):
+        """Test that WARNING records are not held in the buffer"""
+        assert server._log_file_buffer.flushLevel == logging.WARNING
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
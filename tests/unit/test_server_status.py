@@ -0,0 +1,46 @@
+"""
+Unit Tests for the server_status Tool
+
+Tests that the status payload cannot be changed by callers:
+- Mutating a returned response, including nested sections, does not leak
+  into later responses
+"""
+
+import pytest
+import sys
+import os
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from vibe_check import server
+
+
+class TestServerStatus:
+    """Test server_status response isolation"""
+
+    def test_nested_mutation_does_not_leak(self):
+        """Test that changing a nested section only affects that response"""
+        status = server.server_status.fn()
+        status["core_engine_status"]["detection_accuracy"] = "tampered"
+        status["dev_mode_instructions"].clear()
+        status["server_name"] = "tampered"
+
+        fresh = server.server_status.fn()
+
+        assert fresh["core_engine_status"]["detection_accuracy"] == "87.5%"
+        assert fresh["dev_mode_instructions"]
+        assert fresh["server_name"] == "Vibe Check MCP"
+
+    def test_responses_are_independent_objects(self):
+        """Test that nested sections are not shared between responses"""
+        first = server.server_status.fn()
+        second = server.server_status.fn()
+
+        assert first == second
+        assert first["core_engine_status"] is not second["core_engine_status"]
+        assert first["architecture_improvement"] is not second["architecture_improvement"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
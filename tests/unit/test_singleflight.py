@@ -0,0 +1,97 @@
+"""
+Unit Tests for Single-Flight Deduplication
+
+Tests the singleflight decorator used on async MCP tool handlers:
+- Concurrent identical calls share one execution
+- Different arguments (including defaults) run separately
+- Exceptions propagate to every waiter
+- Cancelling one caller does not cancel the shared execution
+"""
+
+import asyncio
+import pytest
+import sys
+import os
+
+# Add src to path for testing
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from vibe_check.utils import singleflight as singleflight_module
+from vibe_check.utils.singleflight import singleflight
+
+
+def _make_tool(calls):
+    @singleflight
+    async def tool(value: int, mode: str = "quick"):
+        calls.append((value, mode))
+        await asyncio.sleep(0.01)
+        return {"value": value, "mode": mode}
+    return tool
+
+
+class TestSingleflight:
+    """Test singleflight behavior"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_execution(self):
+        """Test that identical concurrent calls run the body once"""
+        calls = []
+        tool = _make_tool(calls)
+
+        results = await asyncio.gather(tool(1), tool(1), tool(value=1, mode="quick"))
+
+        assert calls == [(1, "quick")]
+        assert results[0] == results[1] == results[2] == {"value": 1, "mode": "quick"}
+        assert singleflight_module._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_arguments_run_separately(self):
+        """Test that calls with different arguments are not merged"""
+        calls = []
+        tool = _make_tool(calls)
+
+        await asyncio.gather(tool(1), tool(2), tool(1, "comprehensive"))
+
+        assert sorted(calls) == [(1, "comprehensive"), (1, "quick"), (2, "quick")]
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_cached(self):
+        """Test that completed calls are not reused"""
+        calls = []
+        tool = _make_tool(calls)
+
+        await tool(1)
+        await asyncio.sleep(0)
+        await tool(1)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate_to_all_callers(self):
+        """Test that every waiter sees the shared failure"""
+        @singleflight
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(failing(), failing(), return_exceptions=True)
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """Test that the shared execution survives a cancelled caller"""
+        calls = []
+        tool = _make_tool(calls)
+
+        first = asyncio.ensure_future(tool(1))
+        second = asyncio.ensure_future(tool(1))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == {"value": 1, "mode": "quick"}
+        assert calls == [(1, "quick")]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])